@@ -1,6 +1,6 @@
 import os
 from src.grid import Grid
-from src.graph import Graph
+from src.graph import ImplicitGraph
 
 def main():
     """
@@ -20,9 +20,8 @@ def main():
     print("Target grid configuration:")
     print(target_grid)
 
-    # Initialize graph and generate nodes
-    graph = Graph(grid.generate())
-    graph.graph = {node: Grid(m, n, [list(row) for row in node]).neighbors() for node in graph.nodes}
+    # Initialize the state-space graph; neighbors are generated on demand
+    graph = ImplicitGraph(m, n)
 
     # Run BFS algorithm
     print("\nRunning BFS to find the shortest path to the target configuration...")
@@ -1,14 +1,18 @@
+import os
 import pygame
 import sys
-from src.game import show_difficulty_select, start_game
+
+# The game and solver modules import each other by their plain names, as in the tests
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "src"))
+
+from game import init_display, show_difficulty_select, start_game
 
 def main():
     """
     Main function to launch the interactive tile puzzle game.
     """
-    # Initialize Pygame and set the window caption
-    pygame.init()
-    pygame.display.set_caption("Tile Puzzle Game")
+    # Initialize Pygame, create the window and set its caption
+    init_display("Tile Puzzle Game")
 
     # Show the difficulty selection screen and get user's choice
     difficulty = show_difficulty_select()
@@ -1,16 +1,172 @@
 import pygame
+import queue
 import random
 import sys
-
-# Initialize Pygame
-pygame.init()
+import threading
+from grid import Grid
+from incremental import IncrementalSolver
+from hierarchical import HierarchicalSolver
 
 # Window size for the Pygame display
 WINDOW_SIZE = 900
 
+# Game window, created by init_display
+screen = None
+
 # Colors
 WHITE = (255, 255, 255)
 BLACK = (0, 0, 0)
+HINT_COLOR = (0, 120, 255)
+
+# Custom events posted by the hint worker and the auto-solve timer
+HINT_READY = pygame.USEREVENT + 1
+AUTO_STEP = pygame.USEREVENT + 2
+
+# Delay between two moves when auto-solving, in milliseconds
+AUTO_STEP_DELAY = 250
+
+# Number of expansions allowed to an optimal search before falling back to an
+# approximate solution (about half a second on a 4x4 board)
+HINT_BUDGET = 5000
+
+# Length of an approximate solution below which an optimal search is tried again
+EXACT_RETRY_DISTANCE = 12
+
+
+class HintWorker(threading.Thread):
+    """
+    Background thread computing optimal solutions for the current board, so that the
+    game loop keeps running while the solver works.
+
+    Each submitted board gets a new generation number and cancels the search running for
+    the previous one. Results are posted as HINT_READY events carrying the generation they
+    were computed for, so stale results can be ignored by the game loop.
+
+    A move along the current solution only drops its first state. Otherwise, optimal
+    searches are limited to HINT_BUDGET expansions; when the budget is spent, e.g. on most
+    5x5 boards, the worker switches to the approximate solutions of HierarchicalSolver and
+    only tries an optimal search again once they are shorter than EXACT_RETRY_DISTANCE.
+
+    Attributes:
+    -----------
+    solver : IncrementalSolver
+        Solver reused across requests, so that its distance table is kept between moves.
+    approximate : HierarchicalSolver
+        Fallback solver for the boards the optimal search cannot handle within its budget.
+    generation : int
+        Generation number of the latest submitted board.
+    exact : bool
+        Whether the latest solution is optimal.
+    """
+
+    def __init__(self, size):
+        """
+        Initializes the worker for a size x size board.
+
+        Parameters:
+        -----------
+        size : int
+            The number of rows and columns in the grid.
+        """
+        super().__init__(daemon=True)
+        self.solver = IncrementalSolver(size, size)
+        self.approximate = HierarchicalSolver()
+        self.generation = 0
+        self.exact = True
+        self._requests = queue.Queue()
+        self._cancel = threading.Event()
+        self._path = None
+
+    def submit(self, grid, swap=None):
+        """
+        Requests a solution for the given board, cancelling any pending request.
+
+        Parameters:
+        -----------
+        grid : list of list
+            The current board.
+        swap : tuple, optional
+            The pair of cells swapped to reach this board from the previous one, which lets
+            the solver reuse the previous solution.
+        """
+        self._cancel.set()
+        self._cancel = threading.Event()
+        self.generation += 1
+        self._requests.put((self.generation, [row[:] for row in grid], swap, self._cancel))
+
+    def stop(self):
+        """
+        Cancels the running search and terminates the worker.
+        """
+        self._cancel.set()
+        self._requests.put(None)
+
+    def run(self):
+        """
+        Processes requests until stop() is called, skipping those already superseded.
+        """
+        while True:
+            request = self._requests.get()
+            if request is None:
+                return
+            generation, state, swap, cancel = request
+            if cancel.is_set():
+                continue
+
+            grid = Grid(len(state), len(state[0]), state)
+            previous = self._path
+            if previous is not None and swap is not None:
+                before = [list(row) for row in previous[0]]
+                swap_cells(before, swap[0][0], swap[0][1], swap[1][0], swap[1][1])
+                if before != state:
+                    previous = None
+            else:
+                previous = None
+
+            path = None
+            exact = self.exact
+            if previous is not None and len(previous) > 1 and previous[1] == grid.to_tuple():
+                path = previous[1:]
+            elif self.exact and previous is not None:
+                path = self.solver.resolve(previous, swap[0], swap[1], cancel=cancel, budget=HINT_BUDGET)
+            elif self.exact:
+                path = self.solver.solve(grid, cancel=cancel, budget=HINT_BUDGET)
+            if cancel.is_set():
+                continue
+
+            if path is None:
+                path = path_from_swaps(state, self.approximate.get_solution(grid))
+                exact = False
+                if len(path) - 1 <= EXACT_RETRY_DISTANCE:
+                    exact_path = self.solver.solve(grid, cancel=cancel, budget=HINT_BUDGET)
+                    if cancel.is_set():
+                        continue
+                    if exact_path is not None:
+                        path, exact = exact_path, True
+
+            self._path = path
+            self.exact = exact
+            pygame.event.post(pygame.event.Event(HINT_READY, generation=generation, path=path, exact=exact))
+
+# Function to create the game window
+def init_display(caption="Puzzle Game"):
+    """
+    Initializes Pygame and creates the game window used by the drawing functions.
+
+    Parameters:
+    -----------
+    caption : str, optional
+        Title of the window.
+
+    Returns:
+    --------
+    pygame.Surface : The game window.
+    """
+    global screen
+    pygame.init()
+    screen = pygame.display.set_mode((WINDOW_SIZE, WINDOW_SIZE))
+    pygame.display.set_caption(caption)
+    return screen
 
 # Function to shuffle the grid randomly
 def shuffle_grid(size):
@@ -31,8 +187,55 @@ def shuffle_grid(size):
     grid = [numbers[i:i + size] for i in range(0, size * size, size)]
     return grid
 
+# Function to pre-render the numbers displayed in the cells
+def render_glyphs(size, font):
+    """
+    Renders every tile number once, so that drawing a cell only needs a blit.
+
+    Parameters:
+    -----------
+    size : int
+        The number of rows and columns in the grid.
+    font : pygame.font.Font
+        Font to use for rendering numbers in cells.
+
+    Returns:
+    --------
+    dict : Mapping from tile number to its rendered surface.
+    """
+    return {value: font.render(str(value), True, BLACK) for value in range(1, size * size + 1)}
+
+# Function to draw a single cell on the Pygame window
+def draw_cell(grid, y, x, cell_size, glyphs, color=BLACK):
+    """
+    Draws one cell on the Pygame screen.
+
+    Parameters:
+    -----------
+    grid : list of list
+        The grid to draw.
+    y, x : int
+        Coordinates of the cell.
+    cell_size : int
+        Size of each cell in the grid.
+    glyphs : dict
+        Pre-rendered numbers, as returned by render_glyphs.
+    color : tuple, optional
+        Border color of the cell.
+
+    Returns:
+    --------
+    pygame.Rect : The area of the screen that was redrawn.
+    """
+    rect = pygame.Rect(x * cell_size, y * cell_size, cell_size, cell_size)
+    screen.fill(WHITE, rect)
+    pygame.draw.rect(screen, color, rect, 2)
+    number = glyphs[grid[y][x]]
+    screen.blit(number, number.get_rect(center=rect.center))
+    return rect
+
 # Function to draw the grid on the Pygame window
-def draw_grid(grid, cell_size, font):
+def draw_grid(grid, cell_size, font, glyphs=None):
     """
     Draws the grid on the Pygame screen.
 
@@ -44,14 +247,58 @@ def draw_grid(grid, cell_size, font):
         Size of each cell in the grid.
     font : pygame.font.Font
         Font to use for rendering numbers in cells.
+    glyphs : dict, optional
+        Pre-rendered numbers. If not provided, they are rendered with font.
     """
+    if glyphs is None:
+        glyphs = render_glyphs(len(grid), font)
     screen.fill(WHITE)
     for y in range(len(grid)):
         for x in range(len(grid[y])):
-            pygame.draw.rect(screen, BLACK, (x * cell_size, y * cell_size, cell_size, cell_size), 2)
-            number = font.render(str(grid[y][x]), True, BLACK)
-            text_rect = number.get_rect(center=(x * cell_size + cell_size // 2, y * cell_size + cell_size // 2))
-            screen.blit(number, text_rect)
+            draw_cell(grid, y, x, cell_size, glyphs)
+
+# Function to find the next move of a solution path
+def next_swap(path):
+    """
+    Returns the pair of cells swapped between the first two states of a solution path.
+
+    Parameters:
+    -----------
+    path : list of tuple
+        Solution path as returned by IncrementalSolver.
+
+    Returns:
+    --------
+    tuple | None : The two cells to swap, or None if the path is already at the goal.
+    """
+    if len(path) < 2:
+        return None
+    cells = [(y, x) for y in range(len(path[0])) for x in range(len(path[0][y]))
+             if path[0][y][x] != path[1][y][x]]
+    return cells[0], cells[1]
+
+# Function to turn a list of swaps into a solution path
+def path_from_swaps(grid, swaps):
+    """
+    Returns the successive states reached by applying swaps to a grid.
+
+    Parameters:
+    -----------
+    grid : list of list
+        The starting grid. It is not modified.
+    swaps : list of tuple
+        Swaps in the format of Solver.get_solution.
+
+    Returns:
+    --------
+    list of tuple : Solution path in the same format as IncrementalSolver.
+    """
+    state = [list(row) for row in grid]
+    path = [tuple(tuple(row) for row in state)]
+    for (y1, x1), (y2, x2) in swaps:
+        swap_cells(state, y1, x1, y2, x2)
+        path.append(tuple(tuple(row) for row in state))
+    return path
 
 # Function to swap two cells in the grid
 def swap_cells(grid, y1, x1, y2, x2):
@@ -74,6 +321,11 @@ def main(size, cell_size):
     """
     Main game loop for the tile puzzle.
 
+    Solutions are computed by a HintWorker in the background: press H to highlight the
+    next swap and A to toggle auto-solve. The window title shows the number of moves to
+    go, as an upper bound when only an approximate solution is known. Only the cells that
+    changed are redrawn.
+
     Parameters:
     -----------
     size : int
@@ -82,14 +334,31 @@ def main(size, cell_size):
         Size of each cell in the grid.
     """
     font = pygame.font.Font(None, 50)
+    glyphs = render_glyphs(size, font)
     grid = shuffle_grid(size)
     running = True
     selected_cell = None
     moves = 0
+    path = None
+    hint = None
+    show_hint = False
+    auto_solve = False
+
+    worker = HintWorker(size)
+    worker.start()
+    worker.submit(grid)
+
+    draw_grid(grid, cell_size, font, glyphs)
+    pygame.display.flip()
+    pygame.display.set_caption(f"Puzzle Game - {moves} moves, solving...")
 
     while running:
-        for event in pygame.event.get():
+        dirty = []
+        # Block until something happens, so the loop idles between events
+        for event in [pygame.event.wait()] + pygame.event.get():
+            move = None
             if event.type == pygame.QUIT:
+                worker.stop()
                 pygame.quit()
                 sys.exit()
             elif event.type == pygame.MOUSEBUTTONDOWN:
@@ -101,15 +370,49 @@ def main(size, cell_size):
                 else:
                     target_cell = (clicked_row, clicked_col)
                     if abs(selected_cell[0] - target_cell[0]) + abs(selected_cell[1] - target_cell[1]) == 1:
-                        swap_cells(grid, selected_cell[0], selected_cell[1], target_cell[0], target_cell[1])
-                        moves += 1
-                        if all(grid[i][j] == i * size + j + 1 for i in range(size) for j in range(size)):
-                            running = False
+                        move = (selected_cell, target_cell)
                     selected_cell = None
+            elif event.type == pygame.KEYDOWN:
+                if event.key == pygame.K_h:
+                    show_hint = True
+                elif event.key == pygame.K_a:
+                    auto_solve = not auto_solve
+                    pygame.time.set_timer(AUTO_STEP, AUTO_STEP_DELAY if auto_solve else 0)
+            elif event.type == HINT_READY and event.generation == worker.generation:
+                path = event.path
+                to_go = f"{len(path) - 1} to go" if event.exact else f"at most {len(path) - 1} to go"
+                pygame.display.set_caption(f"Puzzle Game - {moves} moves, {to_go}")
+            elif event.type == AUTO_STEP and auto_solve and path is not None:
+                move = next_swap(path)
+
+            if move is not None:
+                (y1, x1), (y2, x2) = move
+                swap_cells(grid, y1, x1, y2, x2)
+                moves += 1
+                path = None
+                show_hint = False
+                worker.submit(grid, move)
+                pygame.display.set_caption(f"Puzzle Game - {moves} moves, solving...")
+                dirty.append(draw_cell(grid, y1, x1, cell_size, glyphs))
+                dirty.append(draw_cell(grid, y2, x2, cell_size, glyphs))
+                if all(grid[i][j] == i * size + j + 1 for i in range(size) for j in range(size)):
+                    running = False
+                    break
+
+            # Keep the highlighted hint in sync with the current solution
+            new_hint = next_swap(path) if show_hint and path is not None else None
+            if new_hint != hint:
+                for y, x in hint or ():
+                    dirty.append(draw_cell(grid, y, x, cell_size, glyphs))
+                for y, x in new_hint or ():
+                    dirty.append(draw_cell(grid, y, x, cell_size, glyphs, HINT_COLOR))
+                hint = new_hint
 
-        draw_grid(grid, cell_size, font)
-        pygame.display.flip()
+        if dirty:
+            pygame.display.update(dirty)
 
+    pygame.time.set_timer(AUTO_STEP, 0)
+    worker.stop()
     show_win_screen(moves)
 
 def show_win_screen(moves):
@@ -197,8 +500,6 @@ def show_difficulty_select():
 
 # Main entry point
 if __name__ == "__main__":
-    screen = pygame.display.set_mode((WINDOW_SIZE, WINDOW_SIZE))
-    pygame.display.set_caption("Puzzle Game")
-
+    init_display()
     difficulty = show_difficulty_select()
     start_game(difficulty)
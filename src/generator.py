@@ -0,0 +1,160 @@
+"""
+This module generates random puzzle instances whose optimal distance to the sorted grid
+is bounded or known exactly, for benchmarks and test inputs.
+"""
+
+import os
+import numpy as np
+from grid import Grid
+from incremental import IncrementalSolver
+from moves import adjacent_pairs
+
+
+def lower_bounds(states, m, n):
+    """
+    Computes an admissible lower bound on the optimal distance of each state: a swap moves
+    two tiles by one cell, so at least half the sum of per-tile Manhattan distances
+    (rounded up) swaps are needed.
+
+    Parameters:
+    -----------
+    states : numpy.ndarray
+        Array of shape (count, m * n) or (count, m, n) of grid states.
+    m : int
+        Number of rows in the grid.
+    n : int
+        Number of columns in the grid.
+
+    Returns:
+    --------
+    numpy.ndarray : Lower bound of each state.
+    """
+    states = np.asarray(states).reshape(-1, m * n)
+    cells = np.arange(m * n)
+    targets = states.astype(np.intp) - 1
+    total = np.abs(cells // n - targets // n) + np.abs(cells % n - targets % n)
+    return (total.sum(axis=1) + 1) // 2
+
+
+def random_walks(m, n, length, count, seed=None):
+    """
+    Generates grids by applying random non-backtracking swaps to the sorted grid, all
+    instances being processed at once with NumPy.
+
+    The optimal distance of each grid is at most length (the walk itself), and at least
+    the value returned by lower_bounds.
+
+    Parameters:
+    -----------
+    m : int
+        Number of rows in the grid.
+    n : int
+        Number of columns in the grid.
+    length : int
+        Number of swaps in each walk.
+    count : int
+        Number of grids to generate.
+    seed : int | numpy.random.Generator, optional
+        Seed of the random generator, for reproducibility.
+
+    Returns:
+    --------
+    numpy.ndarray : Array of shape (count, m, n) of grid states.
+    """
+    rng = np.random.default_rng(seed)
+    pairs = np.array(adjacent_pairs(m, n), dtype=np.intp).reshape(-1, 2)
+    dtype = np.uint8 if m * n < 256 else np.uint16 if m * n < 65536 else np.uint32
+    states = np.tile(np.arange(1, m * n + 1, dtype=dtype), (count, 1))
+    if len(pairs) == 0:
+        # A 1x1 grid has no move
+        return states.reshape(count, m, n)
+    rows = np.arange(count)
+    previous = np.full(count, -1)
+
+    for _ in range(length):
+        # Draw among all pairs but the previous one, so that no swap is immediately undone
+        excluded = (previous >= 0) & (len(pairs) > 1)
+        moves = rng.integers(0, len(pairs) - excluded, size=count)
+        moves += excluded & (moves >= previous)
+        first, second = pairs[moves, 0], pairs[moves, 1]
+        states[rows, first], states[rows, second] = states[rows, second], states[rows, first]
+        previous = moves
+
+    return states.reshape(count, m, n)
+
+
+def generate_grid(m, n, distance, exact=False, seed=None, max_tries=1000, budget=100000):
+    """
+    Generates a single grid at a bounded or exact optimal distance from the sorted grid.
+
+    Parameters:
+    -----------
+    m : int
+        Number of rows in the grid.
+    n : int
+        Number of columns in the grid.
+    distance : int
+        Number of swaps of the random walk. The optimal distance is at most distance.
+    exact : bool, optional
+        If True, only returns a grid whose optimal distance is exactly distance. It is
+        certified by the lower bound when possible, otherwise by an optimal search, whose
+        cost grows exponentially with distance: a fraction of a second up to 3x3 grids,
+        but seconds per try on 4x4 grids.
+    seed : int, optional
+        Seed of the random generator, for reproducibility.
+    max_tries : int, optional
+        Maximum number of walks tried when exact is True.
+    budget : int | None, optional
+        Maximum number of expansions of each optimal search. Walks whose distance cannot be
+        certified within the budget are skipped. None for no limit.
+
+    Returns:
+    --------
+    Grid : The generated grid.
+
+    Raises:
+    -------
+    ValueError : If no grid at exactly the requested distance was found.
+    """
+    rng = np.random.default_rng(seed)
+    solver = IncrementalSolver(m, n) if exact else None
+    for _ in range(max_tries):
+        state = random_walks(m, n, distance, 1, seed=rng)[0]
+        grid = Grid(m, n, state.tolist())
+        if not exact:
+            return grid
+        if lower_bounds(state, m, n)[0] == distance:
+            return grid
+        path = solver.solve(grid, budget=budget)
+        if path is not None and len(path) - 1 == distance:
+            return grid
+    raise ValueError(f"No {m}x{n} grid at distance {distance} found in {max_tries} tries.")
+
+
+def write_grids(states, directory, prefix="grid"):
+    """
+    Writes grid states to .in files in the format read by Grid.from_file.
+
+    Parameters:
+    -----------
+    states : numpy.ndarray
+        Array of shape (count, m, n) of grid states.
+    directory : str
+        Directory where the files are written. It is created if needed.
+    prefix : str, optional
+        Prefix of the file names, followed by the index of the grid.
+
+    Returns:
+    --------
+    list[str] : Paths of the written files.
+    """
+    os.makedirs(directory, exist_ok=True)
+    paths = []
+    for index, state in enumerate(states):
+        path = os.path.join(directory, f"{prefix}{index}.in")
+        with open(path, "w") as file:
+            file.write(f"{state.shape[0]} {state.shape[1]}\n")
+            for row in state:
+                file.write(" ".join(map(str, row)) + "\n")
+        paths.append(path)
+    return paths
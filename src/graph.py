@@ -1,8 +1,174 @@
 """
-This module defines the Graph class for undirected graphs represented by adjacency lists.
+This module defines the Graph class for undirected graphs represented by adjacency lists,
+and the ImplicitGraph class for the state space of the tile puzzle.
+
+The searches first go through fast_solution, which answers single-row and single-column
+grids (the optimal number of swaps is the number of inversions) and tiny grids (complete
+distance tables) exactly, without exploring the state space.
 """
 
+from collections import OrderedDict, deque
+from itertools import permutations
+from math import factorial
 from grid import Grid
+from moves import adjacent_pairs, encode_swaps, decode_path
+from relabel import to_sorted_goal
+
+# Shapes small enough to be answered from a complete distance table
+TABLE_SHAPES = {(2, 2), (2, 3), (3, 2)}
+_tables = {}
+
+
+def count_inversions(values):
+    """
+    Counts the pairs i < j with values[i] > values[j] in O(n log n) with a Fenwick tree.
+    This is the optimal number of adjacent swaps sorting a single-row or single-column grid.
+
+    Parameters:
+    -----------
+    values : list[int]
+        A permutation of 1..n.
+
+    Returns:
+    --------
+    int : The number of inversions.
+    """
+    tree = [0] * (len(values) + 1)
+    inversions = 0
+    for seen, value in enumerate(values):
+        # Number of values seen so far that are smaller than or equal to value
+        smaller = 0
+        index = value
+        while index > 0:
+            smaller += tree[index]
+            index -= index & -index
+        inversions += seen - smaller
+        index = value
+        while index < len(tree):
+            tree[index] += 1
+            index += index & -index
+    return inversions
+
+
+def line_swaps(values):
+    """
+    Yields an optimal sequence of adjacent swaps sorting a permutation, by insertion sort.
+    Each swap removes exactly one inversion, so the sequence has count_inversions(values)
+    swaps and is generated in O(n + inversions).
+
+    Parameters:
+    -----------
+    values : list[int]
+        A permutation of 1..n. It is not modified.
+
+    Yields:
+    -------
+    int : Index k of each swap between positions k and k + 1.
+    """
+    values = list(values)
+    for start in range(1, len(values)):
+        k = start
+        while k > 0 and values[k - 1] > values[k]:
+            values[k - 1], values[k] = values[k], values[k - 1]
+            yield k - 1
+            k -= 1
+
+
+def shape_table(m, n):
+    """
+    Returns the complete distance table of the m x n grids, built once by a BFS from the
+    sorted grid and cached.
+
+    Returns:
+    --------
+    dict : Mapping from each flat state to (distance, next flat state towards the sorted
+    grid), next being None for the sorted grid.
+    """
+    if (m, n) not in _tables:
+        goal = tuple(range(1, m * n + 1))
+        pairs = adjacent_pairs(m, n)
+        table = {goal: (0, None)}
+        queue = deque([goal])
+        while queue:
+            current = queue.popleft()
+            distance = table[current][0]
+            for i, j in pairs:
+                neighbor = list(current)
+                neighbor[i], neighbor[j] = neighbor[j], neighbor[i]
+                neighbor = tuple(neighbor)
+                if neighbor not in table:
+                    table[neighbor] = (distance + 1, current)
+                    queue.append(neighbor)
+        _tables[(m, n)] = table
+    return _tables[(m, n)]
+
+
+def fast_solution(src, dst=None):
+    """
+    Solves single-row, single-column and tiny grids exactly without searching.
+
+    Parameters:
+    -----------
+    src : Grid
+        The source grid configuration.
+    dst : Grid, optional
+        The target grid configuration. Defaults to the sorted grid.
+
+    Returns:
+    --------
+    list[tuple[tuple[int, int], tuple[int, int]]] | None
+        An optimal list of swaps from src to dst, or None if the shape is not handled.
+    """
+    m, n = src.m, src.n
+    if m != 1 and n != 1 and (m, n) not in TABLE_SHAPES:
+        return None
+    relabeled = to_sorted_goal(src, dst) if dst is not None else src
+    flat = [value for row in relabeled.state for value in row]
+
+    if m == 1:
+        return [((0, k), (0, k + 1)) for k in line_swaps(flat)]
+    if n == 1:
+        return [((k, 0), (k + 1, 0)) for k in line_swaps(flat)]
+
+    table = shape_table(m, n)
+    swaps = []
+    current = tuple(flat)
+    while table[current][1] is not None:
+        following = table[current][1]
+        i, j = [index for index in range(m * n) if current[index] != following[index]]
+        swaps.append((divmod(i, n), divmod(j, n)))
+        current = following
+    return swaps
+
+
+def fast_distance(src, dst=None):
+    """
+    Returns the optimal number of swaps from src to dst for the shapes handled by
+    fast_solution, in O(n log n) for single-row and single-column grids, or None.
+    """
+    m, n = src.m, src.n
+    if m != 1 and n != 1 and (m, n) not in TABLE_SHAPES:
+        return None
+    relabeled = to_sorted_goal(src, dst) if dst is not None else src
+    flat = [value for row in relabeled.state for value in row]
+    if m == 1 or n == 1:
+        return count_inversions(flat)
+    return shape_table(m, n)[tuple(flat)][0]
+
+
+def fast_path(src, dst):
+    """
+    Returns the path of grid states (tuples of rows) given by fast_solution, starting with
+    src as the BFS paths do, or None if the shape is not handled.
+
+    Raises:
+    -------
+    ValueError : If src and dst do not contain the same tiles.
+    """
+    swaps = fast_solution(src, dst)
+    if swaps is None:
+        return None
+    return decode_path(src, encode_swaps(swaps, src.m, src.n))
 
 
 class Graph:
@@ -94,6 +260,14 @@ class Graph:
         list[tuple] | None
             A list representing the shortest path from src to dst, or None if no path exists.
         """
+        try:
+            path = fast_path(src, dst)
+        except ValueError:
+            # src and dst do not contain the same tiles
+            return None
+        if path is not None:
+            return path
+
         queue = [src]
         parent_map = {src.to_tuple(): None}
         found_path = False
@@ -135,6 +309,14 @@ class Graph:
         list[tuple] | None
             A list representing the shortest path from src to dst, or None if no path exists.
         """
+        try:
+            path = fast_path(src, dst)
+        except ValueError:
+            # src and dst do not contain the same tiles
+            return None
+        if path is not None:
+            return path
+
         queue = [src]
         parent_map = {src.to_tuple(): None}
         found_path = False
@@ -177,6 +359,15 @@ class Graph:
         list[tuple]
             A list representing the optimal path from src to dst.
         """
+        try:
+            fast = fast_path(src, dst)
+        except ValueError:
+            # src and dst do not contain the same tiles
+            return None
+        if fast is not None:
+            # Like the search below, leave src out of the path
+            return fast[1:]
+
         open_list = [(src, 0, src.manhattan_distance(dst), None)]
         closed_list = []
         path = []
@@ -229,3 +420,147 @@ class Graph:
                 node1, node2 = map(int, file.readline().split())
                 graph.add_edge(node1, node2)
         return graph
+
+
+class NeighborCache:
+    """
+    Read-only mapping from grid states to their neighbors, generated on demand from the
+    grid move rules. Only the most recently expanded states are kept (LRU eviction), so
+    memory grows with the number of states visited rather than with (mn)!.
+
+    Attributes:
+    -----------
+    m : int
+        Number of rows in the grid.
+    n : int
+        Number of columns in the grid.
+    maxsize : int
+        Maximum number of adjacency lists kept in memory.
+    """
+
+    def __init__(self, m, n, maxsize=10000):
+        """
+        Initializes an empty cache for grids of dimensions m x n.
+
+        Parameters:
+        -----------
+        m : int
+            Number of rows in the grid.
+        n : int
+            Number of columns in the grid.
+        maxsize : int, optional
+            Maximum number of adjacency lists kept in memory.
+        """
+        self.m = m
+        self.n = n
+        self.maxsize = maxsize
+        self._cache = OrderedDict()
+
+    def __getitem__(self, node):
+        """
+        Returns the neighbors of a state (tuple of rows) as a list of Grid objects.
+        """
+        neighbors = self._cache.get(node)
+        if neighbors is not None:
+            self._cache.move_to_end(node)
+            return neighbors
+        if node not in self:
+            raise KeyError(node)
+
+        grid = Grid(self.m, self.n, [list(row) for row in node])
+        neighbors = [Grid(self.m, self.n, state) for state in grid.neighbors()]
+        self._cache[node] = neighbors
+        if len(self._cache) > self.maxsize:
+            self._cache.popitem(last=False)
+        return neighbors
+
+    def __contains__(self, node):
+        """
+        Checks whether node is a valid m x n state, i.e. a permutation of 1..mn.
+        """
+        if len(node) != self.m or any(len(row) != self.n for row in node):
+            return False
+        return sorted(value for row in node for value in row) == list(range(1, self.m * self.n + 1))
+
+    def count(self):
+        """
+        Returns the total number of states, (mn)!. This is not __len__, whose result must
+        fit in a C ssize_t, which (mn)! exceeds from 21 cells on.
+        """
+        return factorial(self.m * self.n)
+
+    def __iter__(self):
+        """
+        Iterates lazily over all states, in the same order as Grid.generate.
+        """
+        for perm in permutations(range(1, self.m * self.n + 1)):
+            yield tuple(perm[i * self.n:(i + 1) * self.n] for i in range(self.m))
+
+    def cached(self):
+        """
+        Returns the number of adjacency lists currently held in memory.
+        """
+        return len(self._cache)
+
+
+class ImplicitGraph(Graph):
+    """
+    State-space graph of the m x n tile puzzle whose adjacency lists are generated on
+    demand. It exposes the same interface as a Graph built from Grid.generate, so
+    graph[node], bfs, bfs_improved and a_star work without any precomputation.
+
+    Attributes:
+    -----------
+    m : int
+        Number of rows in the grid.
+    n : int
+        Number of columns in the grid.
+    graph : NeighborCache
+        Lazy adjacency mapping, where graph[node] = [Grid, Grid, ...].
+    nodes : NeighborCache
+        Same object as graph; iterating over it enumerates states lazily.
+    """
+
+    def __init__(self, m, n, cache_size=10000):
+        """
+        Initializes the state-space graph for grids of dimensions m x n.
+
+        Parameters:
+        -----------
+        m : int
+            Number of rows in the grid.
+        n : int
+            Number of columns in the grid.
+        cache_size : int, optional
+            Maximum number of adjacency lists kept in memory.
+        """
+        super().__init__()
+        self.m = m
+        self.n = n
+        self.graph = NeighborCache(m, n, cache_size)
+        self.nodes = self.graph
+        self.nb_nodes = self.graph.count()
+        self.nb_edges = self.nb_nodes * (m * (n - 1) + n * (m - 1)) // 2
+
+    def __str__(self):
+        """
+        Returns a short description of the graph; adjacency lists are not enumerated.
+        """
+        return (f"The implicit graph of {self.m}x{self.n} grids has {self.nb_nodes} nodes "
+                f"and {self.nb_edges} edges ({self.graph.cached()} adjacency lists cached).\n")
+
+    def __repr__(self):
+        """
+        Returns a summary of the graph showing the grid dimensions.
+        """
+        return f"<ImplicitGraph: m={self.m}, n={self.n}, nb_nodes={self.nb_nodes}>"
+
+    def add_edge(self, node1, node2):
+        """
+        Edges are defined by the grid move rules and cannot be added.
+
+        Raises:
+        -------
+        TypeError : Always.
+        """
+        raise TypeError("Edges of an ImplicitGraph are defined by the grid move rules.")
@@ -4,13 +4,127 @@ and its associated methods.
 """
 
 import random
-import numpy as np
+from array import array
 from copy import deepcopy
-import matplotlib.pyplot as plt
 from itertools import permutations
 
 
-class Grid:
+def display_matrix(matrix):
+    """
+    Graphically displays a 2D array of tiles using Matplotlib.
+
+    NumPy and Matplotlib are only imported here, so that the solver can be imported
+    without them.
+
+    Parameters:
+    -----------
+    matrix : numpy.ndarray | list[list[int]]
+        Tile values, where matrix[i][j] is the value at row i, column j.
+    """
+    import numpy as np
+    import matplotlib.pyplot as plt
+
+    matrix = np.flipud(np.asarray(matrix))
+    fig, ax = plt.subplots()
+
+    ax.set_xticks(np.arange(-0.5, matrix.shape[1], 1), minor=True)
+    ax.set_yticks(np.arange(-0.5, matrix.shape[0], 1), minor=True)
+    ax.grid(which='minor', color='black', linestyle='-', linewidth=2)
+
+    for i in range(matrix.shape[0]):
+        for j in range(matrix.shape[1]):
+            ax.text(j, i, str(matrix[i, j]), ha='center', va='center', color='black')
+
+    ax.set_xticks([])
+    ax.set_yticks([])
+    ax.set_title('Grid Display')
+
+    plt.show()
+
+
+class BaseGrid:
+    """
+    Methods shared by Grid and CompactGrid, which only rely on m, n, state and swap.
+    """
+
+    __slots__ = ()
+
+    def __str__(self):
+        """
+        Returns the grid state as a formatted string.
+        """
+        output = "Current grid state:\n"
+        for row in self.state:
+            output += f"{row}\n"
+        return output
+
+    def generate(self):
+        """
+        Generates all possible unique grid states by permutating the sorted list of numbers.
+
+        Returns:
+        --------
+        list of tuple : List of all possible unique grid configurations.
+        """
+        sorted_numbers = list(range(1, self.m * self.n + 1))
+        permutations_list = permutations(sorted_numbers)
+        return [tuple([perm[i * self.n:(i + 1) * self.n] for i in range(self.m)]) for perm in permutations_list]
+
+    def is_adjacent(self, cell1, cell2):
+        """
+        Checks if two cells are adjacent and within grid bounds.
+
+        Parameters:
+        -----------
+        cell1, cell2 : tuple[int]
+            Coordinates of the two cells as (row, column).
+
+        Returns:
+        --------
+        bool : True if cells are adjacent and valid, False otherwise.
+        """
+        if not (0 <= cell1[0] < self.m and 0 <= cell1[1] < self.n):
+            return False
+        if not (0 <= cell2[0] < self.m and 0 <= cell2[1] < self.n):
+            return False
+
+        row_diff = abs(cell1[0] - cell2[0])
+        col_diff = abs(cell1[1] - cell2[1])
+        return (row_diff == 1 and col_diff == 0) or (row_diff == 0 and col_diff == 1)
+
+    def swap_seq(self, cell_pairs):
+        """
+        Performs a sequence of swaps on the grid.
+
+        Parameters:
+        -----------
+        cell_pairs : list[tuple]
+            List of tuples representing pairs of cells to swap.
+        """
+        for cell1, cell2 in cell_pairs:
+            self.swap(cell1, cell2)
+
+    @classmethod
+    def from_file(cls, file_name):
+        """
+        Loads a grid from a specified file.
+
+        Parameters:
+        -----------
+        file_name : str
+            Path to the file containing grid data.
+
+        Returns:
+        --------
+        BaseGrid : Grid of the calling class initialized with the file data.
+        """
+        with open(file_name, "r") as file:
+            m, n = map(int, file.readline().split())
+            state = [list(map(int, file.readline().split())) for _ in range(m)]
+            return cls(m, n, state)
+
+
+class Grid(BaseGrid):
     """
     Represents a grid for the tile swap puzzle, supporting any rectangular dimensions.
 
@@ -44,15 +158,6 @@ class Grid:
             initial_state = [list(range(i * n + 1, (i + 1) * n + 1)) for i in range(m)]
         self.state = initial_state
 
-    def __str__(self):
-        """
-        Returns the grid state as a formatted string.
-        """
-        output = "Current grid state:\n"
-        for row in self.state:
-            output += f"{row}\n"
-        return output
-
     def __repr__(self):
         """
         Returns a concise representation of the grid dimensions.
@@ -63,22 +168,7 @@ class Grid:
         """
         Graphically displays the grid state using Matplotlib.
         """
-        matrix = np.flipud(np.array(self.state))
-        fig, ax = plt.subplots()
-
-        ax.set_xticks(np.arange(-0.5, matrix.shape[1], 1), minor=True)
-        ax.set_yticks(np.arange(-0.5, matrix.shape[0], 1), minor=True)
-        ax.grid(which='minor', color='black', linestyle='-', linewidth=2)
-
-        for i in range(matrix.shape[0]):
-            for j in range(matrix.shape[1]):
-                ax.text(j, i, str(matrix[i, j]), ha='center', va='center', color='black')
-
-        ax.set_xticks([])
-        ax.set_yticks([])
-        ax.set_title('Grid Display')
-
-        plt.show()
+        display_matrix(self.state)
 
     def to_tuple(self):
         """
@@ -86,18 +176,6 @@ class Grid:
         """
         return tuple(tuple(row) for row in self.state)
 
-    def generate(self):
-        """
-        Generates all possible unique grid states by permutating the sorted list of numbers.
-
-        Returns:
-        --------
-        list of tuple : List of all possible unique grid configurations.
-        """
-        sorted_numbers = list(range(1, self.m * self.n + 1))
-        permutations_list = permutations(sorted_numbers)
-        return [tuple([perm[i * self.n:(i + 1) * self.n] for i in range(self.m)]) for perm in permutations_list]
-
     def neighbors(self):
         """
         Generates all neighboring grid states that are one horizontal or vertical swap away.
@@ -138,28 +216,6 @@ class Grid:
                     return False
         return True
 
-    def is_adjacent(self, cell1, cell2):
-        """
-        Checks if two cells are adjacent and within grid bounds.
-
-        Parameters:
-        -----------
-        cell1, cell2 : tuple[int]
-            Coordinates of the two cells as (row, column).
-
-        Returns:
-        --------
-        bool : True if cells are adjacent and valid, False otherwise.
-        """
-        if not (0 <= cell1[0] < self.m and 0 <= cell1[1] < self.n):
-            return False
-        if not (0 <= cell2[0] < self.m and 0 <= cell2[1] < self.n):
-            return False
-
-        row_diff = abs(cell1[0] - cell2[0])
-        col_diff = abs(cell1[1] - cell2[1])
-        return (row_diff == 1 and col_diff == 0) or (row_diff == 0 and col_diff == 1)
-
     def swap(self, cell1, cell2):
         """
         Swaps two cells in the grid if the swap is allowed.
@@ -181,18 +237,6 @@ class Grid:
             self.state[cell1[0]][cell1[1]]
         )
 
-    def swap_seq(self, cell_pairs):
-        """
-        Performs a sequence of swaps on the grid.
-
-        Parameters:
-        -----------
-        cell_pairs : list[tuple]
-            List of tuples representing pairs of cells to swap.
-        """
-        for cell1, cell2 in cell_pairs:
-            self.swap(cell1, cell2)
-
     def manhattan_distance(self, other):
         """
         Calculates the Manhattan distance between two grid states.
@@ -212,20 +256,187 @@ class Grid:
                 distance += abs(self.state[i][j] - other.state[i][j])
         return distance
 
-    def from_file(cls, file_name):
+
+class CompactGrid(BaseGrid):
+    """
+    Memory-compact grid for the tile swap puzzle, backed by a flat array of tiles.
+
+    It provides the same public methods as Grid, but also maintains the position of each
+    tile and the number of misplaced tiles, so that is_sorted runs in O(1) and swap updates
+    everything incrementally.
+
+    Attributes:
+    -----------
+    m : int
+        Number of rows in the grid.
+    n : int
+        Number of columns in the grid.
+    tiles : array.array
+        Flat row-major grid state, where tiles[i * n + j] is the value at row i, column j.
+    positions : array.array
+        Tile index, where positions[value - 1] is the flat position of value.
+    misplaced : int
+        Number of tiles that are not at their sorted position.
+    """
+
+    __slots__ = ("m", "n", "tiles", "positions", "misplaced")
+
+    def __init__(self, m, n, initial_state=None):
         """
-        Loads a grid from a specified file.
+        Initializes the grid with dimensions m x n. By default, creates a sorted grid.
 
         Parameters:
         -----------
-        file_name : str
-            Path to the file containing grid data.
+        m : int
+            Number of rows in the grid.
+        n : int
+            Number of columns in the grid.
+        initial_state : list[list[int]], optional
+            Initial configuration of the grid. If not provided, a sorted grid is generated.
+
+        Raises:
+        -------
+        ValueError : If initial_state is not an m x n arrangement of the tiles 1 to mn.
+        """
+        self.m = m
+        self.n = n
+        typecode = "B" if m * n < 256 else "H" if m * n < 65536 else "I"
+        if initial_state is None:
+            self.tiles = array(typecode, range(1, m * n + 1))
+        else:
+            values = [value for row in initial_state for value in row]
+            if (len(initial_state) != m or any(len(row) != n for row in initial_state)
+                    or sorted(values) != list(range(1, m * n + 1))):
+                raise ValueError(f"Invalid {m}x{n} grid state {initial_state}.")
+            self.tiles = array(typecode, values)
+        self.positions = array(self.tiles.typecode, bytes(self.tiles.itemsize * m * n))
+        self.misplaced = 0
+        for index, value in enumerate(self.tiles):
+            self.positions[value - 1] = index
+            if value != index + 1:
+                self.misplaced += 1
+
+    @property
+    def state(self):
+        """
+        Grid state as a new list of lists, for compatibility with Grid. Modifying it does
+        not modify the grid.
+        """
+        return [self.tiles[i * self.n:(i + 1) * self.n].tolist() for i in range(self.m)]
+
+    def __repr__(self):
+        """
+        Returns a concise representation of the grid dimensions.
+        """
+        return f"<CompactGrid: m={self.m}, n={self.n}>"
+
+    def view(self):
+        """
+        Returns a NumPy m x n view of the tiles sharing memory with the grid (no copy).
+        """
+        import numpy as np
+
+        return np.frombuffer(self.tiles, dtype=self.tiles.typecode).reshape(self.m, self.n)
+
+    def display(self):
+        """
+        Graphically displays the grid state using Matplotlib.
+        """
+        display_matrix(self.view())
+
+    def to_tuple(self):
+        """
+        Converts the grid state to an immutable tuple format.
+        """
+        return tuple(tuple(self.tiles[i * self.n:(i + 1) * self.n]) for i in range(self.m))
+
+    def neighbors(self):
+        """
+        Generates all neighboring grid states that are one horizontal or vertical swap away.
 
         Returns:
         --------
-        Grid : Grid initialized with the file data.
+        list of list : List of neighboring grid states, in the same order as Grid.neighbors.
         """
-        with open(file_name, "r") as file:
-            m, n = map(int, file.readline().split())
-            state = [list(map(int, file.readline().split())) for _ in range(m)]
-            return cls(m, n, state)
+        neighbors = []
+        cell_pairs = [((i, j), (i, j + 1)) for i in range(self.m) for j in range(self.n - 1)]
+        cell_pairs += [((i, j), (i + 1, j)) for j in range(self.n) for i in range(self.m - 1)]
+        for cell1, cell2 in cell_pairs:
+            self.swap(cell1, cell2)
+            neighbors.append(self.state)
+            self.swap(cell1, cell2)
+        return neighbors
+
+    def position(self, value):
+        """
+        Returns the (row, column) coordinates of a tile in O(1).
+
+        Parameters:
+        -----------
+        value : int
+            The tile to locate.
+
+        Returns:
+        --------
+        tuple[int] : Coordinates of the tile.
+        """
+        return divmod(self.positions[value - 1], self.n)
+
+    def is_sorted(self):
+        """
+        Checks if the current grid state is sorted in ascending order, in O(1).
+
+        Returns:
+        --------
+        bool : True if the grid is sorted, False otherwise.
+        """
+        return self.misplaced == 0
+
+    def swap(self, cell1, cell2):
+        """
+        Swaps two cells in the grid if the swap is allowed, updating the tile index and
+        the number of misplaced tiles.
+
+        Parameters:
+        -----------
+        cell1, cell2 : tuple[int]
+            Coordinates of the two cells as (row, column).
+
+        Raises:
+        -------
+        ValueError : If the cells are not adjacent or within grid bounds.
+        """
+        if not self.is_adjacent(cell1, cell2):
+            raise ValueError("The specified cells cannot be swapped.")
+
+        tiles = self.tiles
+        index1 = cell1[0] * self.n + cell1[1]
+        index2 = cell2[0] * self.n + cell2[1]
+        value1, value2 = tiles[index1], tiles[index2]
+        before = (value1 != index1 + 1) + (value2 != index2 + 1)
+        after = (value2 != index1 + 1) + (value1 != index2 + 1)
+
+        tiles[index1], tiles[index2] = value2, value1
+        self.positions[value1 - 1] = index2
+        self.positions[value2 - 1] = index1
+        self.misplaced += after - before
+
+    def manhattan_distance(self, other):
+        """
+        Calculates the Manhattan distance between two grid states, with the same
+        definition as Grid.manhattan_distance.
+
+        Parameters:
+        -----------
+        other : Grid | CompactGrid
+            The target grid state.
+
+        Returns:
+        --------
+        int : Manhattan distance between the current and target grid states.
+        """
+        if isinstance(other, CompactGrid):
+            other_tiles = other.tiles
+        else:
+            other_tiles = [value for row in other.state for value in row]
+        return sum(abs(a - b) for a, b in zip(self.tiles, other_tiles))
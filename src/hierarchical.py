@@ -0,0 +1,161 @@
+"""
+This module defines the HierarchicalSolver class, which solves large grids by fixing the
+top row and the left column, then recursing on the remaining subgrid.
+"""
+
+from grid import Grid
+from incremental import IncrementalSolver
+from moves import encode_path, decode_move
+
+
+class HierarchicalSolver:
+    """
+    Solver for large grids based on a row/column decomposition, giving much shorter
+    solutions than greedy placement.
+
+    The tiles of the top row, then of the left column, are placed one at a time while the
+    already placed tiles stay frozen, and the remaining (m-1) x (n-1) subgrid is solved
+    the same way. Each tile follows a shortest route to its target, chosen by dynamic
+    programming among all shortest routes so that the tiles it pushes aside move towards
+    their own targets as often as possible. Once the remaining subgrid is small enough, it
+    is solved optimally with one IncrementalSolver per subgrid shape, whose distance table
+    is reused across calls.
+
+    Attributes:
+    -----------
+    exact_size : int
+        Maximum number of cells of a subgrid solved optimally.
+    """
+
+    def __init__(self, exact_size=6):
+        """
+        Initializes the solver.
+
+        Parameters:
+        -----------
+        exact_size : int, optional
+            Maximum number of cells of a subgrid solved optimally.
+        """
+        self.exact_size = exact_size
+        self._exact_solvers = {}
+
+    def get_solution(self, grid):
+        """
+        Computes a sequence of swaps sorting the grid. The grid is not modified.
+
+        Parameters:
+        -----------
+        grid : Grid
+            The grid to solve.
+
+        Returns:
+        --------
+        list[tuple[tuple[int, int], tuple[int, int]]]
+            List of swaps in the format [((i1, j1), (i2, j2)), ...], as returned by
+            Solver.get_solution.
+        """
+        m, n = grid.m, grid.n
+        tiles = [value for row in grid.state for value in row]
+        positions = [0] * (m * n)
+        for index, value in enumerate(tiles):
+            positions[value - 1] = index
+        frozen = set()
+        swaps = []
+        top, left = 0, 0
+
+        while (m - top) * (n - left) > self.exact_size:
+            # Cells of the top row, then of the left column, in placement order
+            border = [(top, j) for j in range(left, n)] + [(i, left) for i in range(top + 1, m)]
+            for target in border:
+                value = target[0] * n + target[1] + 1
+                start = divmod(positions[value - 1], n)
+                route = self._route(tiles, n, frozen, start, target)
+                for cell1, cell2 in zip(route, route[1:]):
+                    self._apply(tiles, positions, n, swaps, cell1, cell2)
+                frozen.add(target)
+            top += 1
+            left += 1
+            if top >= m or left >= n:
+                return swaps
+
+        for cell1, cell2 in self._solve_exact(tiles, m, n, top, left):
+            self._apply(tiles, positions, n, swaps, (cell1[0] + top, cell1[1] + left),
+                        (cell2[0] + top, cell2[1] + left))
+        return swaps
+
+    def _apply(self, tiles, positions, n, swaps, cell1, cell2):
+        """
+        Applies a swap to the flat tile list and the tile index, and records it.
+        """
+        index1 = cell1[0] * n + cell1[1]
+        index2 = cell2[0] * n + cell2[1]
+        tiles[index1], tiles[index2] = tiles[index2], tiles[index1]
+        positions[tiles[index1] - 1] = index1
+        positions[tiles[index2] - 1] = index2
+        swaps.append((cell1, cell2))
+
+    def _route(self, tiles, n, frozen, start, target):
+        """
+        Returns a shortest route of cells from start to target avoiding frozen cells.
+
+        Each step of the route swaps the moving tile with the tile in the next cell, which
+        moves one cell back. Among all shortest routes, the one maximizing the number of
+        such pushed tiles getting closer to their target (minus those moving away) is kept.
+        Since a shortest route never enters a cell twice, pushed tiles are those of the
+        current grid and the choice is an exact dynamic program over the bounding box.
+        """
+        (i, j), (ti, tj) = start, target
+        di = 1 if ti > i else -1
+        dj = 1 if tj > j else -1
+        height, width = abs(ti - i) + 1, abs(tj - j) + 1
+
+        def gain(cell, previous):
+            value = tiles[cell[0] * n + cell[1]]
+            gi, gj = divmod(value - 1, n)
+            before = abs(cell[0] - gi) + abs(cell[1] - gj)
+            after = abs(previous[0] - gi) + abs(previous[1] - gj)
+            return before - after
+
+        # best[a][b] is the best gain reaching cell (i + a * di, j + b * dj)
+        best = [[None] * width for _ in range(height)]
+        best[0][0] = 0
+        for a in range(height):
+            for b in range(width):
+                cell = (i + a * di, j + b * dj)
+                if (a, b) == (0, 0) or cell in frozen:
+                    continue
+                candidates = []
+                if a > 0 and best[a - 1][b] is not None:
+                    candidates.append(best[a - 1][b] + gain(cell, (cell[0] - di, cell[1])))
+                if b > 0 and best[a][b - 1] is not None:
+                    candidates.append(best[a][b - 1] + gain(cell, (cell[0], cell[1] - dj)))
+                if candidates:
+                    best[a][b] = max(candidates)
+
+        route = []
+        a, b = height - 1, width - 1
+        while (a, b) != (0, 0):
+            cell = (i + a * di, j + b * dj)
+            route.append(cell)
+            vertical = None
+            if a > 0 and best[a - 1][b] is not None:
+                vertical = best[a - 1][b] + gain(cell, (cell[0] - di, cell[1]))
+            if vertical is not None and vertical == best[a][b]:
+                a -= 1
+            else:
+                b -= 1
+        route.append(start)
+        route.reverse()
+        return route
+
+    def _solve_exact(self, tiles, m, n, top, left):
+        """
+        Returns the relative swaps solving the remaining subgrid optimally, using one
+        IncrementalSolver per subgrid shape.
+        """
+        rows, cols = m - top, n - left
+        labels = {(top + i) * n + left + j + 1: i * cols + j + 1 for i in range(rows) for j in range(cols)}
+        state = [[labels[tiles[(top + i) * n + left + j]] for j in range(cols)] for i in range(rows)]
+        solver = self._exact_solvers.setdefault((rows, cols), IncrementalSolver(rows, cols))
+        path = solver.solve(Grid(rows, cols, state))
+        return [decode_move(move, rows, cols) for move in encode_path(path)]
@@ -0,0 +1,283 @@
+"""
+This module defines the IncrementalSolver class, which keeps the result of previous
+searches so that the optimal remainder can be recomputed quickly after a single swap.
+"""
+
+from heapq import heappush, heappop
+from moves import adjacent_pairs
+
+
+class IncrementalSolver:
+    """
+    Optimal solver for the tile swap puzzle that reuses previous search results.
+
+    Every optimal path found is stored in a distance table mapping each state on the path
+    to its exact distance to the sorted grid and its successor on that path. After a swap,
+    A* is restarted from the new state with the cached exact distances used as heuristic
+    values and the old path as an upper bound.
+
+    The search stops as soon as it reaches a known state, which is immediate when the swap
+    follows the previous path. A swap away from it usually makes the Manhattan lower bound
+    loose, and the search then expands most states within the bound: from 0.3 to 10
+    seconds on 4x4 grids, and it does not finish in practice on 5x5 grids. Pass a budget
+    to give up after a number of expansions instead.
+
+    Attributes:
+    -----------
+    m : int
+        Number of rows in the grid.
+    n : int
+        Number of columns in the grid.
+    goal : tuple[int]
+        Flattened sorted state.
+    table : dict
+        Distance table where table[state] = (distance, next_state) for states whose exact
+        distance to the goal is known. next_state is None for the goal itself.
+    max_table : int
+        Number of states above which the distance table is emptied before recording a new
+        path.
+    """
+
+    def __init__(self, m, n, max_table=100000):
+        """
+        Initializes the solver for grids of dimensions m x n.
+
+        Parameters:
+        -----------
+        m : int
+            Number of rows in the grid.
+        n : int
+            Number of columns in the grid.
+        max_table : int, optional
+            Maximum size of the distance table.
+        """
+        self.m = m
+        self.n = n
+        self.goal = tuple(range(1, m * n + 1))
+        self.max_table = max_table
+        self.table = {self.goal: (0, None)}
+        self._pairs = adjacent_pairs(m, n)
+
+    def _flatten(self, state):
+        """
+        Converts a grid state (list of rows or tuple of rows) to a flat tuple.
+        """
+        return tuple(value for row in state for value in row)
+
+    def _unflatten(self, flat):
+        """
+        Converts a flat tuple back to the tuple of rows format used by Graph paths.
+        """
+        return tuple(flat[i * self.n:(i + 1) * self.n] for i in range(self.m))
+
+    def _heuristic(self, flat):
+        """
+        Returns the exact distance to the goal if it is known, otherwise an admissible
+        lower bound: each swap moves two tiles by one cell, so half the sum of the
+        per-tile Manhattan distances (rounded up) never overestimates.
+        """
+        known = self.table.get(flat)
+        if known is not None:
+            return known[0]
+        total = 0
+        for index, value in enumerate(flat):
+            target = value - 1
+            total += abs(index // self.n - target // self.n) + abs(index % self.n - target % self.n)
+        return (total + 1) // 2
+
+    def _record(self, flat_path):
+        """
+        Stores every state of an optimal path in the distance table, emptying the table
+        first if it would grow beyond max_table states.
+        """
+        if len(self.table) + len(flat_path) > self.max_table:
+            self.table = {self.goal: (0, None)}
+        length = len(flat_path) - 1
+        for index, flat in enumerate(flat_path):
+            if flat in self.table:
+                break
+            next_flat = flat_path[index + 1] if index < length else None
+            self.table[flat] = (length - index, next_flat)
+
+    def _is_path(self, flat_path):
+        """
+        Checks that consecutive states differ by a single swap of adjacent cells and that
+        the last state is the goal.
+        """
+        if not flat_path or flat_path[-1] != self.goal:
+            return False
+        for before, after in zip(flat_path, flat_path[1:]):
+            changed = [index for index in range(len(before)) if before[index] != after[index]]
+            if len(changed) != 2 or tuple(changed) not in self._pairs:
+                return False
+            if before[changed[0]] != after[changed[1]] or before[changed[1]] != after[changed[0]]:
+                return False
+        return True
+
+    def _unroll(self, flat):
+        """
+        Follows the distance table from a known state to the goal.
+        """
+        path = []
+        while flat is not None:
+            path.append(flat)
+            flat = self.table[flat][1]
+        return path
+
+    def _search(self, start, bound=None, cancel=None, budget=None):
+        """
+        Runs A* from a flat start state towards the goal.
+
+        The search stops as soon as the best open node has a known exact distance: its
+        f value is then both a lower bound on and the cost of an actual solution.
+
+        Parameters:
+        -----------
+        start : tuple[int]
+            Flat start state.
+        bound : int, optional
+            Known upper bound on the solution length, used to prune the search.
+        cancel : threading.Event, optional
+            When set, the search is abandoned and None is returned.
+        budget : int, optional
+            Maximum number of expansions, after which None is returned.
+
+        Returns:
+        --------
+        list[tuple[int]] | None : Optimal path of flat states from start to the goal, or None
+        if the search was cancelled or ran out of budget.
+        """
+        if start in self.table:
+            return self._unroll(start)
+
+        counter = 0
+        open_list = [(self._heuristic(start), counter, 0, start)]
+        g_scores = {start: 0}
+        parents = {start: None}
+        expanded = 0
+
+        while open_list:
+            expanded += 1
+            if cancel is not None and expanded % 1024 == 0 and cancel.is_set():
+                return None
+            if budget is not None and expanded > budget:
+                return None
+            _, _, g_cost, current = heappop(open_list)
+            if g_cost > g_scores[current]:
+                continue
+
+            if current in self.table:
+                path = []
+                step = current
+                while step is not None:
+                    path.insert(0, step)
+                    step = parents[step]
+                path.extend(self._unroll(current)[1:])
+                self._record(path)
+                return path
+
+            for i, j in self._pairs:
+                neighbor = list(current)
+                neighbor[i], neighbor[j] = neighbor[j], neighbor[i]
+                neighbor = tuple(neighbor)
+                new_cost = g_cost + 1
+                if new_cost >= g_scores.get(neighbor, new_cost + 1):
+                    continue
+                f_cost = new_cost + self._heuristic(neighbor)
+                if bound is not None and f_cost > bound:
+                    continue
+                g_scores[neighbor] = new_cost
+                parents[neighbor] = current
+                counter += 1
+                heappush(open_list, (f_cost, counter, new_cost, neighbor))
+
+        return None
+
+    def solve(self, grid, cancel=None, budget=None):
+        """
+        Finds an optimal path from the given grid to the sorted grid.
+
+        Parameters:
+        -----------
+        grid : Grid
+            The source grid configuration.
+        cancel : threading.Event, optional
+            When set, the search is abandoned and None is returned.
+        budget : int, optional
+            Maximum number of expansions, after which None is returned.
+
+        Returns:
+        --------
+        list[tuple] | None : Optimal path as a list of grid states (tuples of rows) starting
+        with grid, as returned by Graph.bfs, or None if the search was cancelled or ran out
+        of budget.
+        """
+        path = self._search(self._flatten(grid.state), cancel=cancel, budget=budget)
+        if path is None:
+            return None
+        return [self._unflatten(flat) for flat in path]
+
+    def resolve(self, path, cell1, cell2, cancel=None, budget=None):
+        """
+        Recomputes the optimal remainder after a swap has been applied to the first state
+        of a previously returned optimal path.
+
+        Undoing the swap then following the old path gives an upper bound used to prune the
+        search. The old path is only used as a bound: the distance table only ever holds
+        paths found by the solver itself, and the states of a path it returned are usually
+        still there.
+
+        Parameters:
+        -----------
+        path : list[tuple]
+            Previous path, whose first element is the state before the swap.
+        cell1, cell2 : tuple[int]
+            Coordinates of the two swapped cells as (row, column).
+        cancel : threading.Event, optional
+            When set, the search is abandoned and None is returned.
+        budget : int, optional
+            Maximum number of expansions, after which None is returned.
+
+        Returns:
+        --------
+        list[tuple] | None : Optimal path from the swapped state to the sorted grid, or None
+        if the search was cancelled or ran out of budget.
+
+        Raises:
+        -------
+        ValueError : If the cells are not adjacent, or if path is not a sequence of single
+        swaps ending at the sorted grid.
+        """
+        flat_path = [self._flatten(state) for state in path]
+        if not self._is_path(flat_path):
+            raise ValueError("The previous path is not a sequence of swaps ending at the sorted grid.")
+
+        i = cell1[0] * self.n + cell1[1]
+        j = cell2[0] * self.n + cell2[1]
+        if tuple(sorted((i, j))) not in self._pairs:
+            raise ValueError("The specified cells cannot be swapped.")
+        swapped = list(flat_path[0])
+        swapped[i], swapped[j] = swapped[j], swapped[i]
+
+        new_path = self._search(tuple(swapped), bound=len(flat_path), cancel=cancel, budget=budget)
+        if new_path is None:
+            return None
+        return [self._unflatten(flat) for flat in new_path]
+
+    def moves_to_go(self, grid):
+        """
+        Returns the optimal number of swaps needed to sort the given grid.
+
+        Parameters:
+        -----------
+        grid : Grid
+            The grid configuration.
+
+        Returns:
+        --------
+        int : Length of an optimal solution.
+        """
+        flat = self._flatten(grid.state)
+        if flat not in self.table:
+            self._search(flat)
+        return self.table[flat][0]
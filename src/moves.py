@@ -0,0 +1,298 @@
+"""
+This module defines a compact encoding of solution paths as move indices, and a streaming
+writer and reader for storing very long paths.
+
+A move is the index of a pair of adjacent cells in the grid: horizontal pairs come first,
+row by row, then vertical pairs, column by column (the order used by Grid.neighbors).
+An m x n grid has m(n-1) + n(m-1) moves, so a move fits in one byte for square grids up
+to 11x11 and in two bytes up to 181x181.
+"""
+
+import sys
+from array import array
+
+
+def move_count(m, n):
+    """
+    Returns the number of distinct moves of an m x n grid.
+    """
+    return m * (n - 1) + n * (m - 1)
+
+
+def move_typecode(m, n):
+    """
+    Returns the smallest array typecode able to store every move of an m x n grid.
+    """
+    count = move_count(m, n)
+    return "B" if count <= 256 else "H" if count <= 65536 else "I"
+
+
+def encode_swap(cell1, cell2, m, n):
+    """
+    Returns the move index of a swap between two adjacent cells.
+
+    Parameters:
+    -----------
+    cell1, cell2 : tuple[int]
+        Coordinates of the two cells as (row, column), in any order.
+    m : int
+        Number of rows in the grid.
+    n : int
+        Number of columns in the grid.
+
+    Returns:
+    --------
+    int : The move index.
+
+    Raises:
+    -------
+    ValueError : If the cells are not adjacent or within grid bounds.
+    """
+    (i1, j1), (i2, j2) = sorted((tuple(cell1), tuple(cell2)))
+    if not (0 <= i1 < m and 0 <= j1 < n and 0 <= i2 < m and 0 <= j2 < n):
+        raise ValueError("The specified cells cannot be swapped.")
+    if i1 == i2 and j2 == j1 + 1:
+        return i1 * (n - 1) + j1
+    if j1 == j2 and i2 == i1 + 1:
+        return m * (n - 1) + j1 * (m - 1) + i1
+    raise ValueError("The specified cells cannot be swapped.")
+
+
+def decode_move(move, m, n):
+    """
+    Returns the pair of cells swapped by a move index.
+
+    Parameters:
+    -----------
+    move : int
+        The move index.
+    m : int
+        Number of rows in the grid.
+    n : int
+        Number of columns in the grid.
+
+    Returns:
+    --------
+    tuple[tuple[int, int], tuple[int, int]] : The two cells to swap.
+    """
+    horizontal = m * (n - 1)
+    if not 0 <= move < move_count(m, n):
+        raise ValueError(f"Invalid move {move} for a {m}x{n} grid.")
+    if move < horizontal:
+        i, j = divmod(move, n - 1)
+        return (i, j), (i, j + 1)
+    j, i = divmod(move - horizontal, m - 1)
+    return (i, j), (i + 1, j)
+
+
+def adjacent_pairs(m, n):
+    """
+    Returns the flat indices of the two cells swapped by every move, in move index order.
+
+    Parameters:
+    -----------
+    m : int
+        Number of rows in the grid.
+    n : int
+        Number of columns in the grid.
+
+    Returns:
+    --------
+    list[tuple[int, int]] : pairs[move] = (i * n + j, i2 * n + j2).
+    """
+    pairs = [(i * n + j, i * n + j + 1) for i in range(m) for j in range(n - 1)]
+    pairs += [(i * n + j, (i + 1) * n + j) for j in range(n) for i in range(m - 1)]
+    return pairs
+
+
+def encode_swaps(cell_pairs, m, n):
+    """
+    Encodes a list of swaps, as returned by Solver.get_solution, as move indices.
+
+    Parameters:
+    -----------
+    cell_pairs : list[tuple]
+        List of tuples representing pairs of cells to swap.
+    m : int
+        Number of rows in the grid.
+    n : int
+        Number of columns in the grid.
+
+    Returns:
+    --------
+    array.array : The move indices.
+    """
+    return array(move_typecode(m, n), (encode_swap(cell1, cell2, m, n) for cell1, cell2 in cell_pairs))
+
+
+def decode_swaps(moves, m, n):
+    """
+    Decodes move indices into a list of swaps, as accepted by Grid.swap_seq.
+    """
+    return [decode_move(move, m, n) for move in moves]
+
+
+def encode_path(path):
+    """
+    Encodes a path of grid states, as returned by the Graph searches, as move indices.
+
+    Parameters:
+    -----------
+    path : list[tuple]
+        Consecutive grid states (tuples of rows), each one swap away from the previous one.
+
+    Returns:
+    --------
+    array.array : The move indices.
+
+    Raises:
+    -------
+    ValueError : If two consecutive states are not one swap apart.
+    """
+    m, n = len(path[0]), len(path[0][0])
+    moves = array(move_typecode(m, n))
+    for before, after in zip(path, path[1:]):
+        cells = [(i, j) for i in range(m) if before[i] != after[i] for j in range(n) if before[i][j] != after[i][j]]
+        if len(cells) != 2:
+            raise ValueError("Consecutive states must differ by a single swap.")
+        moves.append(encode_swap(cells[0], cells[1], m, n))
+    return moves
+
+
+def decode_path(start, moves):
+    """
+    Rebuilds the path of grid states obtained by applying moves to a start grid.
+
+    Parameters:
+    -----------
+    start : Grid
+        The initial grid configuration. It is not modified.
+    moves : Iterable[int]
+        The move indices.
+
+    Returns:
+    --------
+    list[tuple] : The path of grid states (tuples of rows), starting with start.
+    """
+    state = [list(row) for row in start.state]
+    path = [tuple(tuple(row) for row in state)]
+    for move in moves:
+        (i1, j1), (i2, j2) = decode_move(move, start.m, start.n)
+        state[i1][j1], state[i2][j2] = state[i2][j2], state[i1][j1]
+        path.append(tuple(tuple(row) for row in state))
+    return path
+
+
+class MoveWriter:
+    """
+    Streaming writer of move indices to a binary file, so that long solutions can be
+    stored without keeping them in memory.
+
+    The file starts with a text line "m n", followed by the moves as little-endian
+    unsigned integers of move_typecode(m, n) size.
+
+    Attributes:
+    -----------
+    m : int
+        Number of rows in the grid.
+    n : int
+        Number of columns in the grid.
+    count : int
+        Number of moves written so far.
+    """
+
+    def __init__(self, file_name, m, n, buffer_size=65536):
+        """
+        Opens the file and writes the header.
+
+        Parameters:
+        -----------
+        file_name : str
+            Path of the file to write.
+        m : int
+            Number of rows in the grid.
+        n : int
+            Number of columns in the grid.
+        buffer_size : int, optional
+            Number of moves buffered before being written to the file.
+        """
+        self.m = m
+        self.n = n
+        self.count = 0
+        self._buffer = array(move_typecode(m, n))
+        self._buffer_size = buffer_size
+        self._file = open(file_name, "wb")
+        self._file.write(f"{m} {n}\n".encode())
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def write(self, move):
+        """
+        Appends a move index.
+        """
+        self._buffer.append(move)
+        self.count += 1
+        if len(self._buffer) >= self._buffer_size:
+            self.flush()
+
+    def write_swap(self, cell1, cell2):
+        """
+        Appends a swap between two adjacent cells.
+        """
+        self.write(encode_swap(cell1, cell2, self.m, self.n))
+
+    def flush(self):
+        """
+        Writes the buffered moves to the file.
+        """
+        if sys.byteorder == "big":
+            self._buffer.byteswap()
+        self._buffer.tofile(self._file)
+        del self._buffer[:]
+
+    def close(self):
+        """
+        Flushes the remaining moves and closes the file.
+        """
+        if not self._file.closed:
+            self.flush()
+            self._file.close()
+
+
+def read_moves(file_name, chunk_size=65536):
+    """
+    Reads a file written by MoveWriter.
+
+    Parameters:
+    -----------
+    file_name : str
+        Path of the file to read.
+    chunk_size : int, optional
+        Number of moves read from the file at a time.
+
+    Returns:
+    --------
+    tuple : (m, n, moves) where moves is a generator yielding the move indices. The file
+    is only open while the generator runs, and closed when it is exhausted or closed.
+    """
+    with open(file_name, "rb") as file:
+        header = file.readline()
+    m, n = map(int, header.split())
+    typecode = move_typecode(m, n)
+
+    def moves():
+        with open(file_name, "rb") as file:
+            file.seek(len(header))
+            while True:
+                chunk = array(typecode, file.read(chunk_size * array(typecode).itemsize))
+                if sys.byteorder == "big":
+                    chunk.byteswap()
+                yield from chunk
+                if len(chunk) < chunk_size:
+                    return
+
+    return m, n, moves()
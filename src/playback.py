@@ -0,0 +1,194 @@
+"""
+This module defines the SolutionPlayer class, which animates a solution on a single
+Matplotlib figure, redrawing only the two swapped cells at each step.
+"""
+
+import numbers
+import numpy as np
+from matplotlib.figure import Figure
+from matplotlib.transforms import Bbox
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from moves import decode_swaps
+
+
+class SolutionPlayer:
+    """
+    Plays back a sequence of swaps on a grid.
+
+    The figure, the grid lines and one text artist per cell are created once. The empty
+    grid is saved as a background and each step restores the background of the two
+    swapped cells only, redraws their text artists and blits them, so the cost of a step
+    does not depend on the grid size.
+
+    Attributes:
+    -----------
+    m : int
+        Number of rows in the grid.
+    n : int
+        Number of columns in the grid.
+    state : list[list[int]]
+        Grid state currently displayed.
+    swaps : list[tuple]
+        The swaps to play, in the format of Solver.get_solution.
+    step : int
+        Number of swaps already played.
+    figure : matplotlib.figure.Figure
+        The figure the grid is drawn on.
+    """
+
+    def __init__(self, grid, swaps, figure=None, cell_size=0.5):
+        """
+        Creates the figure and draws the initial grid.
+
+        Parameters:
+        -----------
+        grid : Grid
+            The initial grid. It is not modified.
+        swaps : list[tuple] | Iterable[int]
+            The swaps to play, either as cell pairs (tuples or lists) or as move indices
+            (see moves.py), including NumPy integers.
+        figure : matplotlib.figure.Figure, optional
+            Figure to draw on, e.g. plt.figure() for an interactive window. By default, an
+            off-screen figure is created, which works without any display.
+        cell_size : float, optional
+            Size of a cell in inches, used for the default figure.
+        """
+        self.m = grid.m
+        self.n = grid.n
+        self.state = [list(row) for row in grid.state]
+        swaps = list(swaps)
+        if swaps and isinstance(swaps[0], numbers.Integral):
+            swaps = decode_swaps(swaps, self.m, self.n)
+        self.swaps = [(tuple(cell1), tuple(cell2)) for cell1, cell2 in swaps]
+        self.step = 0
+
+        if figure is None:
+            figure = Figure(figsize=(max(self.n * cell_size, 2), max(self.m * cell_size, 2)))
+            FigureCanvasAgg(figure)
+        self.figure = figure
+        self._canvas = figure.canvas
+        self._ax = figure.add_axes((0, 0, 1, 1))
+        self._ax.set_xlim(-0.5, self.n - 0.5)
+        self._ax.set_ylim(self.m - 0.5, -0.5)
+        self._ax.set_xticks(np.arange(-0.5, self.n, 1), minor=True)
+        self._ax.set_yticks(np.arange(-0.5, self.m, 1), minor=True)
+        self._ax.grid(which='minor', color='black', linestyle='-', linewidth=2)
+        self._ax.set_xticks([])
+        self._ax.set_yticks([])
+        font_size = max(4, min(12, 300 / max(self.m, self.n)))
+        self._texts = [[self._ax.text(j, i, str(self.state[i][j]), ha='center', va='center',
+                                      color='black', fontsize=font_size, animated=True)
+                        for j in range(self.n)] for i in range(self.m)]
+        self.redraw()
+
+    def redraw(self):
+        """
+        Fully redraws the figure, e.g. after a resize, and saves the empty grid background.
+        """
+        self._canvas.draw()
+        self._background = self._canvas.copy_from_bbox(self.figure.bbox)
+        for row in self._texts:
+            for text in row:
+                self._ax.draw_artist(text)
+        self._canvas.blit(self.figure.bbox)
+
+    def _cell_bbox(self, i, j):
+        """
+        Returns the display coordinates (x1, y1, x2, y2) of a cell, inside its grid lines.
+        """
+        (xa, ya), (xb, yb) = self._ax.transData.transform([(j - 0.45, i - 0.45), (j + 0.45, i + 0.45)])
+        return int(min(xa, xb)), int(min(ya, yb)), int(max(xa, xb)) + 1, int(max(ya, yb)) + 1
+
+    def advance(self):
+        """
+        Plays the next swap, updating only the two swapped cells.
+
+        Returns:
+        --------
+        bool : False if all swaps have already been played.
+        """
+        if self.step >= len(self.swaps):
+            return False
+        (i1, j1), (i2, j2) = self.swaps[self.step]
+        self.state[i1][j1], self.state[i2][j2] = self.state[i2][j2], self.state[i1][j1]
+        self.step += 1
+
+        height = int(self.figure.bbox.height)
+        for i, j in ((i1, j1), (i2, j2)):
+            bbox = self._cell_bbox(i, j)
+            # The saved region is indexed from the top-left corner of the figure
+            x1, y1, x2, y2 = bbox
+            self._canvas.restore_region(self._background, bbox=(x1, height - y2, x2, height - y1), xy=(0, 0))
+            self._texts[i][j].set_text(str(self.state[i][j]))
+            self._ax.draw_artist(self._texts[i][j])
+            self._canvas.blit(Bbox.from_extents(*bbox))
+        return True
+
+    def frame(self):
+        """
+        Returns a copy of the current image as an RGBA array of shape (height, width, 4).
+        """
+        return np.array(self._canvas.buffer_rgba())
+
+    def frames(self, every=1):
+        """
+        Plays the remaining swaps and yields the images, starting with the current one.
+
+        Parameters:
+        -----------
+        every : int, optional
+            Yield one image every this many swaps (the final image is always yielded).
+        """
+        yield self.frame()
+        while self.advance():
+            if self.step % every == 0 or self.step == len(self.swaps):
+                yield self.frame()
+
+    def export(self, file_name, fps=10, every=1):
+        """
+        Plays the remaining swaps and saves them without any display, either as an
+        animated GIF or as an image sequence.
+
+        Parameters:
+        -----------
+        file_name : str
+            Path of a .gif file, or a pattern with a format field such as
+            "frames/step{:05d}.png" to write one image per frame.
+        fps : int, optional
+            Frames per second of the GIF.
+        every : int, optional
+            Keep one frame every this many swaps.
+
+        Returns:
+        --------
+        int : Number of frames written. Identical consecutive frames, e.g. a swap undone
+        within every steps, are written once in a GIF.
+        """
+        from PIL import Image
+
+        if file_name.lower().endswith(".gif"):
+            # Pillow keeps every frame in memory until the GIF is written. It also merges
+            # identical consecutive frames, so drop them here to return the actual count
+            images = []
+            previous = None
+            for frame in self.frames(every):
+                if previous is None or not np.array_equal(frame, previous):
+                    images.append(Image.fromarray(frame).convert("P"))
+                previous = frame
+            images[0].save(file_name, save_all=True, append_images=images[1:],
+                           duration=int(1000 / fps), loop=0)
+            return len(images)
+
+        count = 0
+        for count, frame in enumerate(self.frames(every), 1):
+            Image.fromarray(frame).save(file_name.format(count - 1))
+        return count
+
+    def play(self, interval=0.05):
+        """
+        Plays the remaining swaps in the figure window, waiting interval seconds between
+        steps. The figure must have been created with pyplot.
+        """
+        while self.advance():
+            self._canvas.flush_events()
+            self._canvas.start_event_loop(interval)
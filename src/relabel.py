@@ -0,0 +1,97 @@
+"""
+This module reduces searches towards an arbitrary target grid to searches towards the
+sorted grid, by renaming the tiles.
+
+Since swaps only move tiles around, renaming every tile by its position in dst turns dst
+into the sorted grid and src into an equivalent grid at the same distance. Solvers, tables
+and caches built for the sorted goal can then answer any src -> dst query.
+"""
+
+from grid import Grid
+
+
+def relabeling(dst):
+    """
+    Returns the renaming that maps dst onto the sorted grid.
+
+    Parameters:
+    -----------
+    dst : Grid
+        The target grid configuration.
+
+    Returns:
+    --------
+    dict : Mapping from each tile of dst to its sorted label (flat position + 1).
+    """
+    flat = [value for row in dst.state for value in row]
+    return {value: index + 1 for index, value in enumerate(flat)}
+
+
+def to_sorted_goal(src, dst):
+    """
+    Renames the tiles of src so that the equivalent target is the sorted grid.
+
+    Parameters:
+    -----------
+    src : Grid
+        The source grid configuration.
+    dst : Grid
+        The target grid configuration.
+
+    Returns:
+    --------
+    Grid : The relabeled source grid.
+
+    Raises:
+    -------
+    ValueError : If src and dst do not have the same dimensions and tiles.
+    """
+    if (src.m, src.n) != (dst.m, dst.n):
+        raise ValueError("The source and target grids must have the same dimensions.")
+    src_tiles = sorted(value for row in src.state for value in row)
+    if src_tiles != sorted(value for row in dst.state for value in row):
+        raise ValueError("The source and target grids must contain the same tiles.")
+    labels = relabeling(dst)
+    return Grid(src.m, src.n, [[labels[value] for value in row] for row in src.state])
+
+
+def from_sorted_goal(path, dst):
+    """
+    Maps a path found towards the sorted grid back to the original tile names.
+
+    Parameters:
+    -----------
+    path : list[tuple] | None
+        Path of relabeled grid states (tuples of rows), as returned by the searches.
+    dst : Grid
+        The target grid configuration used for relabeling.
+
+    Returns:
+    --------
+    list[tuple] | None : The path with the original tiles, ending at dst.
+    """
+    if path is None:
+        return None
+    flat = [value for row in dst.state for value in row]
+    return [tuple(tuple(flat[label - 1] for label in row) for row in state) for state in path]
+
+
+def solve_with_goal(solve, src, dst):
+    """
+    Finds a path from src to dst with a solver that only targets the sorted grid.
+
+    Parameters:
+    -----------
+    solve : callable
+        Function taking a Grid and returning a path to the sorted grid, e.g.
+        IncrementalSolver(m, n).solve or lambda grid: graph.a_star(grid, Grid(m, n)).
+    src : Grid
+        The source grid configuration.
+    dst : Grid
+        The target grid configuration.
+
+    Returns:
+    --------
+    list[tuple] | None : Path from src to dst, in the same format as returned by solve.
+    """
+    return from_sorted_goal(solve(to_sorted_goal(src, dst)), dst)
@@ -0,0 +1,287 @@
+"""
+This module defines a local asyncio solver service, so that several processes can share
+the search engines instead of each running its own.
+
+The protocol is one JSON object per line over a localhost TCP connection. A request
+looks like {"m": 2, "n": 2, "state": [[1, 2], [4, 3]], "goal": null, "method": "optimal"}
+and is answered by {"path": [...]} or {"error": "..."}. The request {"metrics": true}
+returns the service metrics.
+
+Requests are rejected when the grid has more cells than MAX_CELLS allows for the method,
+and optimal searches stop after OPTIMAL_BUDGET expansions, so that every job releases its
+worker within tens of seconds.
+"""
+
+import asyncio
+import json
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from grid import Grid
+from graph import ImplicitGraph
+from incremental import IncrementalSolver
+from relabel import solve_with_goal
+
+METHODS = ("optimal", "bfs", "bfs_improved", "a_star")
+
+# Largest number of cells accepted by each method. The graph searches have no budget and
+# take about 10 seconds on the hardest 2x4 grids, but do not finish in minutes on 3x3 grids
+MAX_CELLS = {"optimal": 16, "bfs": 8, "bfs_improved": 8, "a_star": 8}
+
+# Number of expansions after which an optimal search gives up (about 20 seconds on 4x4)
+OPTIMAL_BUDGET = 200000
+
+
+def solve_request(m, n, state, goal, method):
+    """
+    Runs a search in a worker process.
+
+    Parameters:
+    -----------
+    m, n : int
+        Grid dimensions.
+    state : tuple[tuple[int]]
+        The source grid state.
+    goal : tuple[tuple[int]] | None
+        The target grid state, or None for the sorted grid.
+    method : str
+        "optimal" for IncrementalSolver, or the name of an ImplicitGraph search.
+
+    Returns:
+    --------
+    list[list[list[int]]] | None : The path as JSON-serializable lists, or None if no
+    path exists.
+
+    Raises:
+    -------
+    ValueError : If an optimal search runs out of its OPTIMAL_BUDGET expansions.
+    """
+    src = Grid(m, n, [list(row) for row in state])
+    dst = Grid(m, n, [list(row) for row in goal]) if goal is not None else Grid(m, n)
+    if method == "optimal":
+        solver = IncrementalSolver(m, n)
+        path = solve_with_goal(lambda grid: solver.solve(grid, budget=OPTIMAL_BUDGET), src, dst)
+        if path is None:
+            raise ValueError(f"No optimal path found within {OPTIMAL_BUDGET} expansions.")
+    else:
+        path = getattr(ImplicitGraph(m, n), method)(src, dst)
+    if path is None:
+        return None
+    return [[list(row) for row in step] for step in path]
+
+
+class SolverService:
+    """
+    Asyncio server running searches in a process pool.
+
+    Identical concurrent requests, i.e. same (m, n, state, goal, method), are coalesced into
+    a single computation, and pending requests are dispatched smallest grid first. Latency
+    is measured from the time a computation is queued to its completion.
+
+    Attributes:
+    -----------
+    max_workers : int
+        Number of worker processes, which is also the number of searches run at once.
+    port : int | None
+        Port the server listens on, once started.
+    metrics : dict
+        Counters of the service: requests, coalesced, completed, errors, and latency
+        statistics in seconds.
+    """
+
+    def __init__(self, max_workers=2):
+        """
+        Initializes the service without starting it.
+
+        Parameters:
+        -----------
+        max_workers : int, optional
+            Number of worker processes.
+        """
+        self.max_workers = max_workers
+        self.port = None
+        self.metrics = {"requests": 0, "coalesced": 0, "completed": 0, "errors": 0,
+                        "latency_total": 0.0, "latency_max": 0.0}
+        self._pending = {}
+        self._queue = None
+        self._executor = None
+        self._server = None
+        self._dispatchers = []
+        self._writers = set()
+        self._counter = 0
+
+    async def start(self, host="127.0.0.1", port=0):
+        """
+        Starts the worker pool and the server. With port=0, a free port is chosen.
+        """
+        self._queue = asyncio.PriorityQueue()
+        self._executor = ProcessPoolExecutor(self.max_workers)
+        self._dispatchers = [asyncio.create_task(self._dispatch()) for _ in range(self.max_workers)]
+        self._server = await asyncio.start_server(self._handle, host, port)
+        self.port = self._server.sockets[0].getsockname()[1]
+
+    async def stop(self):
+        """
+        Stops the server, the open connections, the dispatchers and the worker pool.
+        """
+        self._server.close()
+        # Since Python 3.12, wait_closed also waits for the connections to be closed
+        for writer in list(self._writers):
+            writer.close()
+        await self._server.wait_closed()
+        for task in self._dispatchers:
+            task.cancel()
+        await asyncio.gather(*self._dispatchers, return_exceptions=True)
+        # Shutting down waits for the running searches, so keep the event loop free meanwhile
+        await asyncio.to_thread(self._executor.shutdown, cancel_futures=True)
+
+    def snapshot(self):
+        """
+        Returns the current metrics, including queue depth and mean latency.
+        """
+        metrics = dict(self.metrics)
+        metrics["queue_depth"] = self._queue.qsize() if self._queue is not None else 0
+        metrics["in_flight"] = len(self._pending)
+        done = metrics["completed"] + metrics["errors"]
+        metrics["latency_mean"] = metrics["latency_total"] / done if done else 0.0
+        return metrics
+
+    async def solve(self, m, n, state, goal=None, method="optimal"):
+        """
+        Solves a request, sharing the computation with identical pending requests.
+
+        Parameters:
+        -----------
+        m, n : int
+            Grid dimensions.
+        state : list[list[int]]
+            The source grid state.
+        goal : list[list[int]], optional
+            The target grid state. Defaults to the sorted grid.
+        method : str, optional
+            One of METHODS.
+
+        Returns:
+        --------
+        list | None : The path, as returned by solve_request.
+
+        Raises:
+        -------
+        ValueError : If the method is unknown, the grid is too large for it, or a state is
+        not an m x n arrangement of the tiles 1 to mn.
+        """
+        if method not in METHODS:
+            raise ValueError(f"Unknown method {method!r}, expected one of {METHODS}.")
+        if m * n > MAX_CELLS[method]:
+            raise ValueError(f"Method {method!r} accepts at most {MAX_CELLS[method]} cells.")
+        state = tuple(tuple(row) for row in state)
+        goal = tuple(tuple(row) for row in goal) if goal is not None else None
+        tiles = list(range(1, m * n + 1))
+        for grid_state in (state, goal):
+            if grid_state is None:
+                continue
+            if (len(grid_state) != m or any(len(row) != n for row in grid_state)
+                    or sorted(value for row in grid_state for value in row) != tiles):
+                raise ValueError(f"Invalid {m}x{n} grid state {grid_state}.")
+        key = (m, n, state, goal, method)
+
+        self.metrics["requests"] += 1
+        future = self._pending.get(key)
+        if future is not None:
+            self.metrics["coalesced"] += 1
+        else:
+            future = asyncio.get_running_loop().create_future()
+            self._pending[key] = future
+            self._counter += 1
+            self._queue.put_nowait((m * n, self._counter, key, time.perf_counter()))
+        return await asyncio.shield(future)
+
+    async def _dispatch(self):
+        """
+        Takes queued requests, smallest grid first, and runs them in the worker pool.
+        """
+        loop = asyncio.get_running_loop()
+        while True:
+            _, _, key, queued = await self._queue.get()
+            future = self._pending[key]
+            try:
+                result = await loop.run_in_executor(self._executor, solve_request, *key)
+            except Exception as error:
+                self.metrics["errors"] += 1
+                future.set_exception(error)
+            else:
+                self.metrics["completed"] += 1
+                future.set_result(result)
+            finally:
+                latency = time.perf_counter() - queued
+                self.metrics["latency_total"] += latency
+                self.metrics["latency_max"] = max(self.metrics["latency_max"], latency)
+                del self._pending[key]
+
+    async def _handle(self, reader, writer):
+        """
+        Serves the requests of one connection.
+        """
+        self._writers.add(writer)
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                try:
+                    request = json.loads(line)
+                    if request.get("metrics"):
+                        response = self.snapshot()
+                    else:
+                        path = await self.solve(request["m"], request["n"], request["state"],
+                                                request.get("goal"), request.get("method", "optimal"))
+                        response = {"path": path}
+                except Exception as error:
+                    response = {"error": str(error)}
+                writer.write(json.dumps(response).encode() + b"\n")
+                await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            self._writers.discard(writer)
+            writer.close()
+
+
+async def query(port, request, host="127.0.0.1"):
+    """
+    Sends a single request to a running SolverService and returns its response.
+
+    Parameters:
+    -----------
+    port : int
+        Port of the service.
+    request : dict
+        The JSON request.
+    host : str, optional
+        Host of the service.
+
+    Returns:
+    --------
+    dict : The JSON response.
+    """
+    reader, writer = await asyncio.open_connection(host, port)
+    writer.write(json.dumps(request).encode() + b"\n")
+    await writer.drain()
+    response = json.loads(await reader.readline())
+    writer.close()
+    await writer.wait_closed()
+    return response
+
+
+async def main(port):
+    """
+    Runs the service until interrupted.
+    """
+    service = SolverService()
+    await service.start(port=port)
+    print(f"Solver service listening on 127.0.0.1:{service.port}")
+    await asyncio.Event().wait()
+
+
+if __name__ == "__main__":
+    asyncio.run(main(int(sys.argv[1]) if len(sys.argv) > 1 else 8765))
@@ -0,0 +1,97 @@
+"""
+This module checks many solutions at once with NumPy, replaying every instance of a batch
+in parallel instead of calling Grid.swap_seq and Grid.is_sorted on each one.
+
+Move sequences use the move indices of moves.py, padded with -1 after the end of shorter
+sequences.
+"""
+
+import numpy as np
+from moves import move_count, adjacent_pairs
+
+
+def swaps_to_moves(swaps, m, n):
+    """
+    Converts a batch of swap sequences given as cell coordinates to move indices.
+
+    Parameters:
+    -----------
+    swaps : numpy.ndarray
+        Integer array of shape (count, length, 2, 2), where swaps[k, t] = ((i1, j1), (i2, j2))
+        is step t of instance k. Padding steps are filled with -1.
+    m : int
+        Number of rows in the grid.
+    n : int
+        Number of columns in the grid.
+
+    Returns:
+    --------
+    numpy.ndarray : Array of shape (count, length) of move indices, -1 for padding and
+    move_count(m, n) for swaps between cells that are not adjacent or within bounds.
+    """
+    swaps = np.asarray(swaps, dtype=np.intp)
+    i1, j1, i2, j2 = swaps[..., 0, 0], swaps[..., 0, 1], swaps[..., 1, 0], swaps[..., 1, 1]
+    padding = (swaps == -1).all(axis=(-2, -1))
+    in_bounds = ((0 <= i1) & (i1 < m) & (0 <= j1) & (j1 < n) & (0 <= i2) & (i2 < m) & (0 <= j2) & (j2 < n))
+    horizontal = (i1 == i2) & (np.abs(j1 - j2) == 1)
+    vertical = (j1 == j2) & (np.abs(i1 - i2) == 1)
+
+    moves = np.full(i1.shape, move_count(m, n), dtype=np.intp)
+    moves = np.where(in_bounds & horizontal, i1 * (n - 1) + np.minimum(j1, j2), moves)
+    moves = np.where(in_bounds & vertical, m * (n - 1) + j1 * (m - 1) + np.minimum(i1, i2), moves)
+    return np.where(padding, -1, moves)
+
+
+def validate_batch(starts, moves, m, n):
+    """
+    Replays a batch of move sequences and checks that each one is legal and sorts its
+    start grid.
+
+    Parameters:
+    -----------
+    starts : numpy.ndarray
+        Array of shape (count, m, n) or (count, m * n) of start grid states.
+    moves : numpy.ndarray
+        Integer array of shape (count, length) of move indices, padded with -1.
+    m : int
+        Number of rows in the grid.
+    n : int
+        Number of columns in the grid.
+
+    Returns:
+    --------
+    tuple[numpy.ndarray, numpy.ndarray]
+        first_invalid : index of the first illegal step of each instance, or -1 if every
+        step is legal. A step is illegal if it is not a valid move index, or if it comes
+        after padding.
+        solved : True for the instances whose steps are all legal and end on the sorted
+        grid.
+    """
+    states = np.array(starts).reshape(-1, m * n)
+    moves = np.asarray(moves, dtype=np.intp)
+    moves = moves.reshape(len(states), moves.shape[-1])
+    count, length = moves.shape
+    goal = np.arange(1, m * n + 1)
+    if length == 0:
+        return np.full(count, -1), (states == goal).all(axis=1)
+    pairs = np.array(adjacent_pairs(m, n), dtype=np.intp).reshape(-1, 2)
+
+    padding = moves == -1
+    illegal = ~padding & ((moves < 0) | (moves >= len(pairs)))
+    # A move after padding means the sequence is malformed
+    illegal |= ~padding & (np.cumsum(padding, axis=1) > 0)
+    has_illegal = illegal.any(axis=1)
+    first_invalid = np.where(has_illegal, illegal.argmax(axis=1), -1)
+
+    active = ~padding & ~illegal & (~has_illegal[:, None] | (np.arange(length) < first_invalid[:, None]))
+    safe_moves = np.where(active, moves, 0)
+    for step in range(length):
+        rows = np.flatnonzero(active[:, step])
+        if len(rows) == 0:
+            continue
+        first = pairs[safe_moves[rows, step], 0]
+        second = pairs[safe_moves[rows, step], 1]
+        states[rows, first], states[rows, second] = states[rows, second], states[rows, first]
+
+    solved = ~has_illegal & (states == goal).all(axis=1)
+    return first_invalid, solved
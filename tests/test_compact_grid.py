@@ -0,0 +1,79 @@
+import sys
+sys.path.append("src/")
+
+import unittest
+from grid import Grid, CompactGrid
+
+class TestCompactGrid(unittest.TestCase):
+    """
+    Unit tests for the array-backed CompactGrid.
+    """
+
+    def test_from_file(self):
+        """
+        Tests loading grid dimensions and state from 'input/grid1.in'.
+        """
+        grid = CompactGrid.from_file("input/grid1.in")
+        self.assertEqual(grid.m, 4)
+        self.assertEqual(grid.n, 2)
+        self.assertEqual(grid.state, [[1, 2], [3, 4], [5, 6], [8, 7]])
+        self.assertEqual(grid.misplaced, 2)
+        self.assertEqual(grid.position(8), (3, 0))
+
+    def test_swap_updates_sortedness(self):
+        """
+        Tests that swaps keep the misplaced count and tile index up to date.
+        """
+        grid = CompactGrid.from_file("input/grid1.in")
+        self.assertFalse(grid.is_sorted())
+        grid.swap((3, 0), (3, 1))
+        self.assertTrue(grid.is_sorted())
+        self.assertEqual(grid.position(8), (3, 1))
+        grid.swap_seq([((0, 0), (1, 0)), ((0, 0), (0, 1))])
+        self.assertEqual(grid.state, [[2, 3], [1, 4], [5, 6], [7, 8]])
+        self.assertEqual(grid.misplaced, 3)
+        with self.assertRaises(ValueError):
+            grid.swap((0, 0), (1, 1))
+
+    def test_same_results_as_grid(self):
+        """
+        Tests that the public methods agree with Grid.
+        """
+        state = [[1, 6], [2, 3], [4, 5]]
+        grid = Grid(3, 2, [row[:] for row in state])
+        compact = CompactGrid(3, 2, state)
+        self.assertEqual(compact.to_tuple(), grid.to_tuple())
+        self.assertEqual(compact.neighbors(), grid.neighbors())
+        self.assertEqual(compact.state, state)
+        self.assertEqual(compact.manhattan_distance(Grid(3, 2)), grid.manhattan_distance(Grid(3, 2)))
+        self.assertEqual(compact.manhattan_distance(CompactGrid(3, 2)), grid.manhattan_distance(Grid(3, 2)))
+
+    def test_view_shares_memory(self):
+        """
+        Tests that the NumPy view reflects swaps without copying.
+        """
+        grid = CompactGrid(2, 2)
+        view = grid.view()
+        grid.swap((0, 0), (0, 1))
+        self.assertEqual(view.tolist(), [[2, 1], [3, 4]])
+
+    def test_large_grid(self):
+        """
+        Tests that grids with more than 255 tiles use a wider item type.
+        """
+        grid = CompactGrid(20, 20)
+        self.assertTrue(grid.is_sorted())
+        self.assertEqual(grid.position(400), (19, 19))
+        self.assertEqual(grid.view()[19, 19], 400)
+
+    def test_invalid_state(self):
+        """
+        Tests that states which are not permutations of the tiles are rejected.
+        """
+        for state in ([[0, 2], [3, 4]], [[1, 1], [3, 4]], [[1, 2], [3, 400]], [[1, 2, 3, 4]],
+                      [[1, 2, 3], [4]]):
+            with self.assertRaises(ValueError):
+                CompactGrid(2, 2, state)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,86 @@
+import sys
+sys.path.append("src/")
+
+import random
+import time
+import unittest
+from grid import Grid
+from graph import ImplicitGraph, count_inversions, fast_solution, fast_distance
+from incremental import IncrementalSolver
+
+class TestFastPaths(unittest.TestCase):
+    """
+    Unit tests for the exact fast paths of single-row, single-column and tiny grids.
+    """
+
+    def test_count_inversions(self):
+        """
+        Tests the Fenwick tree count against the quadratic definition.
+        """
+        values = list(range(1, 60))
+        random.Random(0).shuffle(values)
+        expected = sum(values[i] > values[j] for i in range(len(values)) for j in range(i + 1, len(values)))
+        self.assertEqual(count_inversions(values), expected)
+
+    def test_line_solutions(self):
+        """
+        Tests that row and column solutions are optimal and sort the grid.
+        """
+        row = Grid(1, 6, [[3, 1, 6, 2, 5, 4]])
+        column = Grid(6, 1, [[3], [1], [6], [2], [5], [4]])
+        for grid in (row, column):
+            swaps = fast_solution(grid)
+            self.assertEqual(len(swaps), IncrementalSolver(grid.m, grid.n).moves_to_go(grid))
+            self.assertEqual(len(swaps), fast_distance(grid))
+            grid.swap_seq(swaps)
+            self.assertTrue(grid.is_sorted())
+
+    def test_table_shapes(self):
+        """
+        Tests that 2x2, 2x3 and 3x2 grids are answered from the complete tables, including
+        towards an arbitrary goal.
+        """
+        for m, n in [(2, 2), (2, 3), (3, 2)]:
+            numbers = list(range(1, m * n + 1))
+            random.Random(m * n).shuffle(numbers)
+            grid = Grid(m, n, [numbers[i * n:(i + 1) * n] for i in range(m)])
+            self.assertEqual(fast_distance(grid), IncrementalSolver(m, n).moves_to_go(grid))
+            goal = Grid(m, n, [row[::-1] for row in Grid(m, n).state])
+            path = ImplicitGraph(m, n).bfs(grid, goal)
+            self.assertEqual(path[0], grid.to_tuple())
+            self.assertEqual(path[-1], goal.to_tuple())
+            self.assertEqual(len(path) - 1, fast_distance(grid, goal))
+        self.assertIsNone(fast_solution(Grid(3, 3)))
+
+    def test_a_star_format(self):
+        """
+        Tests that a_star leaves src out of its path with and without a fast path.
+        """
+        for m, n in [(2, 3), (3, 3)]:
+            grid = Grid(m, n)
+            grid.swap((0, 0), (0, 1))
+            self.assertEqual(ImplicitGraph(m, n).a_star(grid, Grid(m, n)), [Grid(m, n).to_tuple()])
+            self.assertEqual(ImplicitGraph(m, n).a_star(Grid(m, n), Grid(m, n)), [])
+
+    def test_different_tiles(self):
+        """
+        Tests that the searches find no path between grids with different tiles.
+        """
+        graph = ImplicitGraph(2, 2)
+        src = Grid(2, 2, [[1, 1], [3, 4]])
+        for search in (graph.bfs, graph.bfs_improved, graph.a_star):
+            self.assertIsNone(search(src, Grid(2, 2)))
+
+    def test_long_row_distance(self):
+        """
+        Tests that the distance of a 1 x 20000 grid is computed quickly.
+        """
+        numbers = list(range(1, 20001))
+        random.Random(1).shuffle(numbers)
+        start = time.perf_counter()
+        distance = fast_distance(Grid(1, 20000, [numbers]))
+        self.assertLess(time.perf_counter() - start, 1.0)
+        self.assertGreater(distance, 0)
+
+if __name__ == '__main__':
+    unittest.main()
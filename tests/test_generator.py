@@ -0,0 +1,73 @@
+import sys
+sys.path.append("src/")
+
+import tempfile
+import unittest
+import numpy as np
+from grid import Grid
+from incremental import IncrementalSolver
+from generator import random_walks, lower_bounds, generate_grid, write_grids
+
+class TestGenerator(unittest.TestCase):
+    """
+    Unit tests for the puzzle generator.
+    """
+
+    def test_random_walks_bounds(self):
+        """
+        Tests that generated grids are permutations within the walk length.
+        """
+        states = random_walks(3, 3, 6, 200, seed=0)
+        self.assertEqual(states.shape, (200, 3, 3))
+        self.assertTrue((np.sort(states.reshape(200, -1), axis=1) == np.arange(1, 10)).all())
+        bounds = lower_bounds(states, 3, 3)
+        solver = IncrementalSolver(3, 3)
+        for state, bound in zip(states[:20], bounds[:20]):
+            distance = solver.moves_to_go(Grid(3, 3, state.tolist()))
+            self.assertLessEqual(bound, distance)
+            self.assertLessEqual(distance, 6)
+            self.assertEqual(distance % 2, 0)
+
+    def test_single_cell(self):
+        """
+        Tests that walks on a 1x1 grid, which has no move, return the sorted grid.
+        """
+        self.assertEqual(random_walks(1, 1, 5, 3, seed=0).tolist(), [[[1]]] * 3)
+
+    def test_exact_budget(self):
+        """
+        Tests that walks which cannot be certified within the search budget are skipped.
+        """
+        with self.assertRaises(ValueError):
+            generate_grid(4, 4, 16, exact=True, seed=0, max_tries=2, budget=10)
+
+    def test_seed_reproducibility(self):
+        """
+        Tests that the same seed gives the same grids.
+        """
+        self.assertTrue((random_walks(4, 4, 20, 50, seed=1) == random_walks(4, 4, 20, 50, seed=1)).all())
+        self.assertEqual(generate_grid(4, 4, 10, seed=2).state, generate_grid(4, 4, 10, seed=2).state)
+
+    def test_exact_distance(self):
+        """
+        Tests that exact mode returns grids at exactly the requested optimal distance.
+        """
+        for seed in range(5):
+            grid = generate_grid(3, 3, 7, exact=True, seed=seed)
+            self.assertEqual(IncrementalSolver(3, 3).moves_to_go(grid), 7)
+
+    def test_write_grids(self):
+        """
+        Tests that written files can be loaded back.
+        """
+        states = random_walks(2, 3, 4, 3, seed=3)
+        with tempfile.TemporaryDirectory() as directory:
+            paths = write_grids(states, directory)
+            self.assertEqual(len(paths), 3)
+            with open(paths[1]) as file:
+                lines = file.read().split("\n")
+            self.assertEqual(lines[0], "2 3")
+            self.assertEqual([list(map(int, line.split())) for line in lines[1:3]], states[1].tolist())
+
+if __name__ == '__main__':
+    unittest.main()
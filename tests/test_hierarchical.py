@@ -0,0 +1,51 @@
+import sys
+sys.path.append("src/")
+
+import random
+import unittest
+from grid import Grid
+from incremental import IncrementalSolver
+from hierarchical import HierarchicalSolver
+
+def random_grid(m, n, seed):
+    """
+    Returns a uniformly shuffled m x n grid.
+    """
+    numbers = list(range(1, m * n + 1))
+    random.Random(seed).shuffle(numbers)
+    return Grid(m, n, [numbers[i * n:(i + 1) * n] for i in range(m)])
+
+class TestHierarchicalSolver(unittest.TestCase):
+    """
+    Unit tests for the row/column decomposition solver.
+    """
+
+    def test_solutions_sort_the_grid(self):
+        """
+        Tests that solutions of various shapes sort the grid without modifying it.
+        """
+        solver = HierarchicalSolver()
+        for m, n in [(1, 12), (12, 1), (2, 9), (5, 3), (8, 8), (20, 20)]:
+            grid = random_grid(m, n, m * n)
+            state = [row[:] for row in grid.state]
+            swaps = solver.get_solution(grid)
+            self.assertEqual(grid.state, state)
+            grid.swap_seq(swaps)
+            self.assertTrue(grid.is_sorted(), f"{m}x{n} grid not sorted")
+
+    def test_small_grid_is_optimal(self):
+        """
+        Tests that grids below the exact size are solved optimally.
+        """
+        grid = Grid(3, 2, [[1, 6], [2, 3], [4, 5]])
+        self.assertEqual(len(HierarchicalSolver().get_solution(grid)), IncrementalSolver(3, 2).moves_to_go(grid))
+
+    def test_row_is_optimal(self):
+        """
+        Tests that a reversed row is solved with exactly its number of inversions.
+        """
+        grid = Grid(1, 8, [[8, 7, 6, 5, 4, 3, 2, 1]])
+        self.assertEqual(len(HierarchicalSolver().get_solution(grid)), 28)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,64 @@
+import sys
+sys.path.append("src/")
+
+import unittest
+from grid import Grid
+from graph import ImplicitGraph
+
+class TestImplicitGraph(unittest.TestCase):
+    """
+    Unit tests for the lazily generated state-space graph.
+    """
+
+    def test_same_neighbors_as_generated_graph(self):
+        """
+        Tests that adjacency lists match those built from Grid.generate.
+        """
+        grid = Grid(2, 2)
+        graph = ImplicitGraph(2, 2)
+        self.assertEqual(graph.nodes.count(), 24)
+        self.assertEqual(list(graph.nodes), grid.generate())
+        for node in grid.generate():
+            expected = Grid(2, 2, [list(row) for row in node]).neighbors()
+            self.assertEqual([neighbor.state for neighbor in graph.graph[node]], expected)
+
+    def test_large_grid(self):
+        """
+        Tests that a 5x5 graph, with more than 2**63 states, can be created.
+        """
+        graph = ImplicitGraph(5, 5)
+        self.assertEqual(graph.nb_nodes, 15511210043330985984000000)
+        self.assertEqual(len(graph.graph[next(iter(graph.nodes))]), 40)
+
+    def test_bfs(self):
+        """
+        Tests BFS on a 3x3 grid, which has no fast path, without precomputing the graph.
+        """
+        graph = ImplicitGraph(3, 3)
+        path = graph.bfs(Grid(3, 3, [[1, 2, 3], [5, 4, 6], [8, 9, 7]]), Grid(3, 3))
+        self.assertEqual(path[0], ((1, 2, 3), (5, 4, 6), (8, 9, 7)))
+        self.assertEqual(path[-1], ((1, 2, 3), (4, 5, 6), (7, 8, 9)))
+        self.assertEqual(len(path) - 1, 3)
+        self.assertGreater(graph.graph.cached(), 0)
+
+    def test_cache_is_bounded(self):
+        """
+        Tests that the number of cached adjacency lists never exceeds the cache size.
+        """
+        graph = ImplicitGraph(3, 3, cache_size=5)
+        graph.bfs(Grid(3, 3, [[1, 2, 3], [5, 4, 6], [8, 9, 7]]), Grid(3, 3))
+        self.assertEqual(graph.graph.cached(), 5)
+
+    def test_invalid_node(self):
+        """
+        Tests that states which are not permutations of the tiles are rejected.
+        """
+        graph = ImplicitGraph(2, 2)
+        self.assertNotIn(((1, 1), (2, 3)), graph.graph)
+        with self.assertRaises(KeyError):
+            graph.graph[((1, 1), (2, 3))]
+        with self.assertRaises(TypeError):
+            graph.add_edge(((1, 2), (3, 4)), ((2, 1), (3, 4)))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,89 @@
+import sys
+sys.path.append("src/")
+
+import random
+import unittest
+from grid import Grid
+from incremental import IncrementalSolver
+
+class TestIncrementalSolver(unittest.TestCase):
+    """
+    Unit tests for the incremental re-solve after a swap.
+    """
+
+    def test_solve_optimal_length(self):
+        """
+        Tests that a 3x2 grid known to need 4 swaps is solved optimally.
+        """
+        solver = IncrementalSolver(3, 2)
+        path = solver.solve(Grid(3, 2, [[1, 6], [2, 3], [4, 5]]))
+        self.assertEqual(path[0], ((1, 6), (2, 3), (4, 5)))
+        self.assertEqual(path[-1], ((1, 2), (3, 4), (5, 6)))
+        self.assertEqual(len(path) - 1, 4)
+
+    def test_resolve_along_path(self):
+        """
+        Tests that following the previous path reuses its remainder.
+        """
+        solver = IncrementalSolver(2, 2)
+        path = solver.solve(Grid(2, 2, [[4, 3], [2, 1]]))
+        first, second = path[0], path[1]
+        cells = [(i, j) for i in range(2) for j in range(2) if first[i][j] != second[i][j]]
+        self.assertEqual(solver.resolve(path, cells[0], cells[1]), path[1:])
+
+    def test_resolve_off_path(self):
+        """
+        Tests that a swap away from the previous path gives an optimal remainder.
+        """
+        grid = Grid(3, 3, [[1, 2, 3], [5, 4, 6], [8, 9, 7]])
+        solver = IncrementalSolver(3, 3)
+        path = solver.solve(grid)
+        grid.swap((0, 0), (0, 1))
+        new_path = solver.resolve(path, (0, 0), (0, 1))
+        self.assertEqual(new_path[0], grid.to_tuple())
+        self.assertEqual(len(new_path) - 1, IncrementalSolver(3, 3).moves_to_go(grid))
+        self.assertEqual(solver.moves_to_go(grid), len(path))
+
+    def test_resolve_invalid_path(self):
+        """
+        Tests that a path which is not a chain of swaps to the goal is rejected and does not
+        change later answers.
+        """
+        solver = IncrementalSolver(2, 2)
+        bad_path = [((1, 2), (4, 3)), ((2, 1), (3, 4)), ((1, 2), (3, 4))]
+        with self.assertRaises(ValueError):
+            solver.resolve(bad_path, (0, 0), (0, 1))
+        self.assertEqual(solver.moves_to_go(Grid(2, 2, [[2, 1], [3, 4]])), 1)
+
+    def test_budget(self):
+        """
+        Tests that the search gives up once its expansion budget is spent.
+        """
+        grid = Grid(3, 3, [[9, 8, 7], [6, 5, 4], [3, 2, 1]])
+        self.assertIsNone(IncrementalSolver(3, 3).solve(grid, budget=10))
+        self.assertIsNotNone(IncrementalSolver(3, 3).solve(Grid(3, 3, [[2, 1, 3], [4, 5, 6], [7, 8, 9]]), budget=10))
+
+    def test_table_bounded(self):
+        """
+        Tests that the distance table is emptied instead of growing beyond max_table.
+        """
+        solver = IncrementalSolver(3, 3, max_table=20)
+        rng = random.Random(0)
+        for _ in range(10):
+            values = list(range(1, 10))
+            rng.shuffle(values)
+            path = solver.solve(Grid(3, 3, [values[0:3], values[3:6], values[6:9]]))
+            self.assertEqual(path[-1], ((1, 2, 3), (4, 5, 6), (7, 8, 9)))
+            self.assertLessEqual(len(solver.table), 20 + len(path))
+
+    def test_resolve_invalid_swap(self):
+        """
+        Tests that non-adjacent cells are rejected.
+        """
+        solver = IncrementalSolver(2, 2)
+        path = solver.solve(Grid(2, 2))
+        with self.assertRaises(ValueError):
+            solver.resolve(path, (0, 0), (1, 1))
+
+if __name__ == '__main__':
+    unittest.main()
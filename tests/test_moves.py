@@ -0,0 +1,87 @@
+import sys
+sys.path.append("src/")
+
+import gc
+import os
+import tempfile
+import unittest
+import warnings
+from grid import Grid
+from graph import ImplicitGraph
+from moves import (move_count, encode_swap, decode_move, adjacent_pairs, encode_swaps, decode_swaps,
+                   encode_path, decode_path, MoveWriter, read_moves)
+
+class TestMoves(unittest.TestCase):
+    """
+    Unit tests for move-encoded paths.
+    """
+
+    def test_every_move_round_trips(self):
+        """
+        Tests that each move index decodes to a distinct adjacent pair and back.
+        """
+        grid = Grid(3, 4)
+        pairs = [decode_move(move, 3, 4) for move in range(move_count(3, 4))]
+        self.assertEqual(len(set(pairs)), 17)
+        for move, (cell1, cell2) in enumerate(pairs):
+            self.assertTrue(grid.is_adjacent(cell1, cell2))
+            self.assertEqual(encode_swap(cell1, cell2, 3, 4), move)
+            self.assertEqual(encode_swap(cell2, cell1, 3, 4), move)
+        with self.assertRaises(ValueError):
+            encode_swap((0, 0), (1, 1), 3, 4)
+        with self.assertRaises(ValueError):
+            decode_move(17, 3, 4)
+        self.assertEqual(adjacent_pairs(3, 4), [(i1 * 4 + j1, i2 * 4 + j2) for (i1, j1), (i2, j2) in pairs])
+
+    def test_path_round_trip(self):
+        """
+        Tests conversion between state paths, swap lists and move indices.
+        """
+        src = Grid(3, 2, [[1, 6], [2, 3], [4, 5]])
+        path = ImplicitGraph(3, 2).bfs(src, Grid(3, 2))
+        moves = encode_path(path)
+        self.assertEqual(len(moves), len(path) - 1)
+        self.assertEqual(decode_path(src, moves), path)
+        swaps = decode_swaps(moves, 3, 2)
+        self.assertEqual(list(encode_swaps(swaps, 3, 2)), list(moves))
+        src.swap_seq(swaps)
+        self.assertTrue(src.is_sorted())
+
+    def test_streaming(self):
+        """
+        Tests writing and reading back a long path in several chunks.
+        """
+        moves = [move % move_count(100, 100) for move in range(0, 300000, 7)]
+        with tempfile.TemporaryDirectory() as directory:
+            file_name = os.path.join(directory, "path.moves")
+            with MoveWriter(file_name, 100, 100, buffer_size=1000) as writer:
+                for move in moves:
+                    writer.write(move)
+                writer.write_swap((99, 98), (99, 99))
+            self.assertEqual(writer.count, len(moves) + 1)
+            self.assertLess(os.path.getsize(file_name), 3 * writer.count)
+            m, n, read = read_moves(file_name, chunk_size=999)
+            self.assertEqual((m, n), (100, 100))
+            self.assertEqual(list(read), moves + [encode_swap((99, 98), (99, 99), 100, 100)])
+
+    def test_read_without_iterating(self):
+        """
+        Tests that reading the header only, or stopping early, leaves no file open.
+        """
+        with tempfile.TemporaryDirectory() as directory:
+            file_name = os.path.join(directory, "moves.bin")
+            with MoveWriter(file_name, 3, 3) as writer:
+                for move in range(12):
+                    writer.write(move)
+            with warnings.catch_warnings(record=True) as caught:
+                warnings.simplefilter("always", ResourceWarning)
+                m, n, unused = read_moves(file_name)
+                _, _, partial = read_moves(file_name, chunk_size=4)
+                self.assertEqual(next(partial), 0)
+                del unused, partial
+                gc.collect()
+            self.assertEqual((m, n), (3, 3))
+            self.assertEqual([warning for warning in caught if warning.category is ResourceWarning], [])
+
+if __name__ == '__main__':
+    unittest.main()
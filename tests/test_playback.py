@@ -0,0 +1,78 @@
+import sys
+sys.path.append("src/")
+
+import os
+import tempfile
+import unittest
+import numpy as np
+from PIL import Image
+from grid import Grid
+from moves import encode_swaps
+from playback import SolutionPlayer
+
+class TestSolutionPlayer(unittest.TestCase):
+    """
+    Unit tests for the solution playback renderer.
+    """
+
+    def setUp(self):
+        self.grid = Grid(3, 4, [[2, 1, 3, 4], [5, 6, 8, 7], [9, 10, 12, 11]])
+        self.swaps = [((0, 0), (0, 1)), ((1, 2), (1, 3)), ((2, 2), (2, 3))]
+
+    def test_partial_redraw_matches_full_redraw(self):
+        """
+        Tests that updating only the swapped cells gives the same image as drawing the
+        final grid from scratch.
+        """
+        player = SolutionPlayer(self.grid, self.swaps)
+        while player.advance():
+            pass
+        self.assertEqual(player.step, 3)
+        self.assertEqual(player.state, Grid(3, 4).state)
+        self.assertTrue((player.frame() == SolutionPlayer(Grid(3, 4), []).frame()).all())
+        self.assertEqual(self.grid.state[0], [2, 1, 3, 4])
+
+    def test_move_indices(self):
+        """
+        Tests that solutions given as move indices are played the same way.
+        """
+        player = SolutionPlayer(self.grid, encode_swaps(self.swaps, 3, 4))
+        frames = list(player.frames())
+        self.assertEqual(len(frames), 4)
+        self.assertEqual(player.state, Grid(3, 4).state)
+
+    def test_swap_formats(self):
+        """
+        Tests that swaps given as lists, e.g. loaded from JSON, and NumPy move indices are
+        accepted.
+        """
+        as_lists = [[list(cell1), list(cell2)] for cell1, cell2 in self.swaps]
+        as_numpy = np.array(encode_swaps(self.swaps, 3, 4), dtype=np.int64)
+        for swaps in (as_lists, as_numpy):
+            player = SolutionPlayer(self.grid, swaps)
+            self.assertEqual(player.swaps, self.swaps)
+            while player.advance():
+                pass
+            self.assertEqual(player.state, Grid(3, 4).state)
+
+    def test_export(self):
+        """
+        Tests headless export to a GIF and to an image sequence.
+        """
+        with tempfile.TemporaryDirectory() as directory:
+            gif = os.path.join(directory, "solution.gif")
+            self.assertEqual(SolutionPlayer(self.grid, self.swaps).export(gif), 4)
+            with Image.open(gif) as image:
+                self.assertEqual(image.n_frames, 4)
+            undone = os.path.join(directory, "undone.gif")
+            count = SolutionPlayer(self.grid, self.swaps[:1] * 2 + self.swaps).export(undone, every=2)
+            with Image.open(undone) as image:
+                self.assertEqual(image.n_frames, count)
+            os.remove(undone)
+            pattern = os.path.join(directory, "step{:03d}.png")
+            self.assertEqual(SolutionPlayer(self.grid, self.swaps).export(pattern, every=2), 3)
+            self.assertEqual(sorted(os.listdir(directory)),
+                             ["solution.gif", "step000.png", "step001.png", "step002.png"])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,50 @@
+import sys
+sys.path.append("src/")
+
+import unittest
+from grid import Grid
+from graph import ImplicitGraph
+from incremental import IncrementalSolver
+from relabel import to_sorted_goal, from_sorted_goal, solve_with_goal
+
+class TestRelabel(unittest.TestCase):
+    """
+    Unit tests for arbitrary-goal searches through relabeling.
+    """
+
+    def test_target_becomes_sorted(self):
+        """
+        Tests that relabeling with dst maps dst onto the sorted grid and back.
+        """
+        dst = Grid(2, 3, [[6, 4, 5], [1, 3, 2]])
+        self.assertTrue(to_sorted_goal(dst, dst).is_sorted())
+        src = Grid(2, 3, [[4, 6, 5], [1, 2, 3]])
+        relabeled = to_sorted_goal(src, dst)
+        self.assertEqual(relabeled.state, [[2, 1, 3], [4, 6, 5]])
+        self.assertEqual(from_sorted_goal([relabeled.to_tuple()], dst), [src.to_tuple()])
+
+    def test_same_length_as_direct_search(self):
+        """
+        Tests that solving through the sorted goal gives an optimal path to dst.
+        """
+        src = Grid(3, 2, [[1, 6], [2, 3], [4, 5]])
+        dst = Grid(3, 2, [[2, 1], [4, 3], [6, 5]])
+        direct = ImplicitGraph(3, 2).bfs(src, dst)
+        path = solve_with_goal(IncrementalSolver(3, 2).solve, src, dst)
+        self.assertEqual(path[0], src.to_tuple())
+        self.assertEqual(path[-1], dst.to_tuple())
+        self.assertEqual(len(path), len(direct))
+
+    def test_invalid_grids(self):
+        """
+        Tests that grids with different shapes or tiles are rejected.
+        """
+        with self.assertRaises(ValueError):
+            to_sorted_goal(Grid(2, 3), Grid(3, 2))
+        with self.assertRaises(ValueError):
+            to_sorted_goal(Grid(2, 2, [[1, 2], [3, 5]]), Grid(2, 2))
+        with self.assertRaises(ValueError):
+            to_sorted_goal(Grid(2, 2, [[1, 1], [3, 4]]), Grid(2, 2))
+
+if __name__ == '__main__':
+    unittest.main()
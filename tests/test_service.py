@@ -0,0 +1,123 @@
+import sys
+sys.path.append("src/")
+
+import asyncio
+import unittest
+from service import SolverService, query
+
+class TestSolverService(unittest.TestCase):
+    """
+    Unit tests for the local solver service, run on localhost.
+    """
+
+    def run_with_service(self, scenario):
+        """
+        Starts a service, runs scenario(service) and stops the service.
+        """
+        async def run():
+            service = SolverService(max_workers=1)
+            await service.start()
+            try:
+                return await scenario(service)
+            finally:
+                await service.stop()
+        return asyncio.run(run())
+
+    def test_solve_over_socket(self):
+        """
+        Tests a request to the sorted grid and one to an arbitrary goal.
+        """
+        async def scenario(service):
+            sorted_response = await query(service.port, {"m": 3, "n": 2, "state": [[1, 6], [2, 3], [4, 5]]})
+            goal_response = await query(service.port, {"m": 2, "n": 2, "state": [[1, 2], [3, 4]],
+                                                       "goal": [[2, 1], [3, 4]], "method": "bfs"})
+            return sorted_response, goal_response
+
+        sorted_response, goal_response = self.run_with_service(scenario)
+        self.assertEqual(len(sorted_response["path"]) - 1, 4)
+        self.assertEqual(sorted_response["path"][-1], [[1, 2], [3, 4], [5, 6]])
+        self.assertEqual(goal_response["path"], [[[1, 2], [3, 4]], [[2, 1], [3, 4]]])
+
+    def test_coalescing_and_metrics(self):
+        """
+        Tests that identical concurrent requests are computed once.
+        """
+        async def scenario(service):
+            request = {"m": 3, "n": 3, "state": [[1, 2, 3], [5, 4, 6], [8, 9, 7]]}
+            responses = await asyncio.gather(*(query(service.port, request) for _ in range(5)))
+            metrics = await query(service.port, {"metrics": True})
+            return responses, metrics
+
+        responses, metrics = self.run_with_service(scenario)
+        self.assertTrue(all(response == responses[0] for response in responses))
+        self.assertEqual(metrics["requests"], 5)
+        self.assertEqual(metrics["coalesced"], 4)
+        self.assertEqual(metrics["completed"], 1)
+        self.assertEqual(metrics["queue_depth"], 0)
+        self.assertGreater(metrics["latency_mean"], 0)
+
+    def test_small_grids_first(self):
+        """
+        Tests that queued requests are dispatched smallest grid first.
+        """
+        async def scenario(service):
+            order = []
+
+            async def solve(m, n, state):
+                await service.solve(m, n, state)
+                order.append((m, n))
+
+            blocker = asyncio.create_task(solve(2, 3, [[4, 5, 6], [1, 2, 3]]))
+            await asyncio.sleep(0)
+            await asyncio.gather(solve(3, 3, [[2, 1, 3], [4, 5, 6], [7, 8, 9]]), solve(1, 2, [[2, 1]]), blocker)
+            return order
+
+        order = self.run_with_service(scenario)
+        self.assertEqual(order[1:], [(1, 2), (3, 3)])
+
+    def test_invalid_request(self):
+        """
+        Tests that invalid requests get an error response.
+        """
+        async def scenario(service):
+            return (await query(service.port, {"m": 2, "n": 2, "state": [[1, 1], [2, 3]]}),
+                    await query(service.port, {"m": 2, "n": 2, "state": [[1, 2, 3], [4]]}),
+                    await query(service.port, {"m": 2, "n": 2, "state": [[1, 2], [3, 4]], "method": "dfs"}))
+
+        for response in self.run_with_service(scenario):
+            self.assertIn("error", response)
+
+    def test_size_limits(self):
+        """
+        Tests that grids too large for a method are rejected without reaching a worker.
+        """
+        async def scenario(service):
+            state = [[5 * i + j + 1 for j in range(5)] for i in range(5)]
+            return (await query(service.port, {"m": 5, "n": 5, "state": state}),
+                    await query(service.port, {"m": 3, "n": 3, "state": [[1, 2, 3], [4, 5, 6], [7, 9, 8]],
+                                               "method": "bfs"}),
+                    service.snapshot())
+
+        optimal, bfs, metrics = self.run_with_service(scenario)
+        self.assertIn("error", optimal)
+        self.assertIn("error", bfs)
+        self.assertEqual(metrics["completed"] + metrics["errors"], 0)
+
+    def test_stop_with_idle_connection(self):
+        """
+        Tests that stopping the service closes connections waiting for a request.
+        """
+        async def run():
+            service = SolverService(max_workers=1)
+            await service.start()
+            reader, writer = await asyncio.open_connection("127.0.0.1", service.port)
+            await query(service.port, {"metrics": True})
+            await asyncio.wait_for(service.stop(), timeout=10)
+            closed = await asyncio.wait_for(reader.read(), timeout=10)
+            writer.close()
+            return closed
+
+        self.assertEqual(asyncio.run(run()), b"")
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,39 @@
+import sys
+sys.path.append("src/")
+
+import subprocess
+import time
+import unittest
+
+HEADLESS_IMPORT = "import sys; sys.path.append('src/'); import grid, graph, incremental, solver"
+
+def run_python(code):
+    """
+    Runs code in a fresh interpreter and returns its output and wall-clock time.
+    """
+    start = time.perf_counter()
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+    return result.stdout, time.perf_counter() - start
+
+class TestStartup(unittest.TestCase):
+    """
+    Startup-time guard for short-lived solver workers.
+    """
+
+    def test_no_visualization_imports(self):
+        """
+        Tests that importing the solver core does not load NumPy, Matplotlib or Pygame.
+        """
+        output, _ = run_python(HEADLESS_IMPORT + "; print(sorted(m for m in ('numpy', 'matplotlib', 'pygame') if m in sys.modules))")
+        self.assertEqual(output.strip(), "[]")
+
+    def test_import_latency(self):
+        """
+        Tests that importing the solver core adds less than 100 ms to interpreter startup.
+        """
+        baseline = min(run_python("pass")[1] for _ in range(3))
+        headless = min(run_python(HEADLESS_IMPORT)[1] for _ in range(3))
+        self.assertLess(headless - baseline, 0.1)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,83 @@
+import sys
+sys.path.append("src/")
+
+import unittest
+import numpy as np
+from grid import Grid
+from moves import decode_swaps, move_count
+from validate import swaps_to_moves, validate_batch
+
+def scrambled(m, n, count, length, seed):
+    """
+    Returns start grids obtained from random moves, and the reversed moves solving them.
+    """
+    rng = np.random.default_rng(seed)
+    moves = rng.integers(0, move_count(m, n), size=(count, length))
+    starts = []
+    for sequence in moves:
+        grid = Grid(m, n)
+        grid.swap_seq(decode_swaps(sequence, m, n))
+        starts.append(grid.state)
+    return np.array(starts), moves[:, ::-1].copy()
+
+class TestValidate(unittest.TestCase):
+    """
+    Unit tests for the vectorized batch validator.
+    """
+
+    def test_valid_solutions(self):
+        """
+        Tests that correct solutions are accepted.
+        """
+        starts, solutions = scrambled(4, 5, 50, 12, seed=0)
+        first_invalid, solved = validate_batch(starts, solutions, 4, 5)
+        self.assertTrue((first_invalid == -1).all())
+        self.assertTrue(solved.all())
+
+    def test_invalid_solutions(self):
+        """
+        Tests illegal moves, wrong moves, padding and moves after padding.
+        """
+        starts, solutions = scrambled(3, 3, 4, 6, seed=1)
+        solutions[0, 2] = move_count(3, 3)
+        solutions[1, 5] = (solutions[1, 5] + 1) % move_count(3, 3)
+        solutions[2, 4] = -1
+        solutions[3, 1] = -1
+        first_invalid, solved = validate_batch(starts, solutions, 3, 3)
+        self.assertEqual(first_invalid.tolist(), [2, -1, 5, 2])
+        self.assertEqual(solved.tolist(), [False, False, False, False])
+
+    def test_padded_solutions(self):
+        """
+        Tests that sequences of different lengths can share a batch.
+        """
+        starts, solutions = scrambled(2, 3, 2, 4, seed=2)
+        padded = np.full((2, 7), -1)
+        padded[:, :4] = solutions
+        first_invalid, solved = validate_batch(starts, padded, 2, 3)
+        self.assertEqual(first_invalid.tolist(), [-1, -1])
+        self.assertTrue(solved.all())
+        self.assertEqual(starts.tolist(), scrambled(2, 3, 2, 4, seed=2)[0].tolist())
+
+    def test_empty_batches(self):
+        """
+        Tests batches of empty sequences and empty batches.
+        """
+        starts = np.array([Grid(2, 2).state, [[2, 1], [3, 4]]])
+        first_invalid, solved = validate_batch(starts, np.zeros((2, 0), dtype=int), 2, 2)
+        self.assertEqual(first_invalid.tolist(), [-1, -1])
+        self.assertEqual(solved.tolist(), [True, False])
+        for length in (0, 3):
+            first_invalid, solved = validate_batch(np.zeros((0, 2, 2), dtype=int),
+                                                   np.zeros((0, length), dtype=int), 2, 2)
+            self.assertEqual((len(first_invalid), len(solved)), (0, 0))
+
+    def test_swaps_to_moves(self):
+        """
+        Tests the conversion of cell coordinates, including illegal swaps and padding.
+        """
+        swaps = np.array([[[[0, 0], [0, 1]], [[1, 2], [0, 2]], [[0, 0], [1, 1]], [[-1, -1], [-1, -1]]]])
+        self.assertEqual(swaps_to_moves(swaps, 2, 3).tolist(), [[0, 6, 7, -1]])
+
+if __name__ == '__main__':
+    unittest.main()